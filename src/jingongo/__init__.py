@@ -1,2 +1,36 @@
-from .jingongo import Jingongo 
-__version__ = "0.1.4"  # Version of the Jingongo framework
\ No newline at end of file
+__version__ = "0.1.4"  # Version of the Jingongo framework
+
+# Public names are resolved lazily so that lightweight entry points (such as the
+# `jingongo` CLI talking to a running agent) do not pay for importing `requests`.
+_LAZY_EXPORTS = {
+    "Jingongo": ".jingongo",
+    "RateLimiter": ".rate_limit",
+    "ConversionJob": ".records",
+    "ConversionJobList": ".records",
+    "JobStatus": ".records",
+    "CancellationToken": ".deadline",
+    "JingongoAuthError": ".jingongo",
+    "JingongoAPIError": ".jingongo",
+    "JingongoRateLimitError": ".jingongo",
+    "JingongoIntegrityError": ".jingongo",
+    "JingongoTimeoutError": ".jingongo",
+    "JingongoSubmissionError": ".jingongo",
+    "JingongoConversionError": ".jingongo",
+    "JingongoVariantConversionError": ".jingongo",
+    "JingongoCancelledError": ".jingongo",
+}
+
+# Submodules stay reachable as attributes (e.g. `jingongo.jingongo.JingongoAPIError`),
+# as they were when this package imported its client eagerly.
+_LAZY_SUBMODULES = ("jingongo", "rate_limit", "records", "deadline", "endpoints", "streaming", "agent", "cli")
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS or name in _LAZY_SUBMODULES:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS.get(name, f".{name}"), __name__)
+        return module if name in _LAZY_SUBMODULES else getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_LAZY_EXPORTS)
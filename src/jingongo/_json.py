@@ -0,0 +1,25 @@
+# src/jingongo/_json.py
+
+"""JSON decoding backend: uses `orjson` when it is installed, the standard library otherwise."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decodes a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error type subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,342 @@
+# src/jingongo/agent.py
+
+"""
+A long-lived local agent that keeps an authenticated Jingongo client warm.
+
+The agent listens on a Unix socket and executes CLI commands on behalf of
+short-lived `jingongo` invocations, so they skip interpreter-heavy imports,
+TLS handshakes and API key verification. This module deliberately avoids
+importing `requests` at module level: the client side of the protocol must
+stay cheap to import.
+
+Protocol: the caller sends one JSON line `{"command": ..., "args": {...}}`,
+optionally with an `"identity"` describing the client it expects (see
+`client_identity`). The agent answers with zero or more `{"record": {...}}`
+lines followed by a final `{"ok": true}` or
+`{"ok": false, "error": ..., "error_type": ...}` line. A request whose identity
+does not match the agent's client is refused with `IDENTITY_MISMATCH` before
+any record is sent.
+"""
+
+import os
+import json
+import hashlib
+import time
+import socket
+import logging
+import threading
+import socketserver
+from pathlib import Path
+from typing import Optional, Dict, Any, Union, Callable, Iterator, List
+
+_logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("COMPLETED", "FAILED")
+
+# `error_type` of commands refused because the caller expects a different client.
+IDENTITY_MISMATCH = "AgentIdentityMismatch"
+
+# A command handler receives (client, command, args, watcher) and yields records.
+CommandHandler = Callable[[Any, str, Dict[str, Any], "JobWatcher"], Iterator[Dict[str, Any]]]
+
+
+class JingongoAgentError(Exception):
+    """Raised on the client side when the agent reports a failed command."""
+
+    def __init__(self, message: str, error_type: str = "Exception"):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def is_supported() -> bool:
+    """Returns True if this platform supports Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def client_identity(api_urls: Optional[List[str]] = None, api_key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Describes a client by its API URLs and a fingerprint of its key (never the key itself).
+
+    Fields that are not given are left out, and are then not checked by the agent.
+    """
+    identity: Dict[str, Any] = {}
+    if api_urls:
+        identity["api_urls"] = [url.rstrip('/') for url in api_urls]
+    if api_key:
+        identity["key_fingerprint"] = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    return identity
+
+
+def default_socket_path() -> Path:
+    """Returns the agent socket path, honouring `JINGONGO_AGENT_SOCKET`."""
+    env_path = os.environ.get("JINGONGO_AGENT_SOCKET")
+    if env_path:
+        return Path(env_path)
+    return Path.home() / ".jingongo" / "agent.sock"
+
+
+# --- Client side ---
+
+def call_agent(socket_path: Union[str, Path], command: str, args: Optional[Dict[str, Any]] = None,
+               identity: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Sends a command to a running agent.
+
+    The connection is established eagerly, so an `OSError` is raised here if no
+    agent is listening; records are then yielded lazily as they arrive. With an
+    `identity` (see `client_identity`), the agent refuses the command unless its
+    client matches, raising `JingongoAgentError` with `IDENTITY_MISMATCH`.
+
+    Raises:
+        OSError: If the agent cannot be reached.
+        JingongoAgentError: (while iterating) if the command failed in the agent.
+    """
+    if not is_supported():
+        raise OSError("Unix domain sockets are not supported on this platform.")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+        message: Dict[str, Any] = {"command": command, "args": args or {}}
+        if identity:
+            message["identity"] = identity
+        request = json.dumps(message) + "\n"
+        sock.sendall(request.encode("utf-8"))
+    except OSError:
+        sock.close()
+        raise
+    return _read_responses(sock)
+
+
+def _read_responses(sock: socket.socket) -> Iterator[Dict[str, Any]]:
+    with sock, sock.makefile("r", encoding="utf-8") as stream:
+        for line in stream:
+            message = json.loads(line)
+            if "record" in message:
+                yield message["record"]
+                continue
+            if not message.get("ok"):
+                raise JingongoAgentError(message.get("error", "Unknown agent error."),
+                                         message.get("error_type", "Exception"))
+            return
+    raise JingongoAgentError("Agent closed the connection before completing the command.")
+
+
+# --- Server side ---
+
+class JobWatcher:
+    """
+    Polls the status of in-flight conversion jobs from a single background thread.
+
+    Multiple callers waiting on (or asking about) the same job share one polling
+    loop instead of each hitting the status endpoint. Finished jobs are forgotten
+    `terminal_ttl` seconds after their last refresh, and jobs whose status cannot
+    be fetched `max_errors` times in a row are no longer polled.
+    """
+
+    def __init__(self, client, poll_interval: float = 5.0, terminal_ttl: float = 600.0, max_errors: int = 5):
+        self.client = client
+        self.poll_interval = poll_interval
+        self.terminal_ttl = terminal_ttl
+        self.max_errors = max_errors
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="jingongo-job-watcher", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout=self.poll_interval)
+
+    def _update(self, job_id: str, record: Dict[str, Any]) -> None:
+        with self._cond:
+            self._jobs[job_id] = {"record": record, "fetched": time.monotonic(), "errors": 0, "error": None}
+            self._cond.notify_all()
+
+    def _record_error(self, job_id: str, error: Exception) -> None:
+        with self._cond:
+            entry = self._jobs.get(job_id)
+            if entry is None:
+                return
+            entry["errors"] += 1
+            if entry["errors"] >= self.max_errors:
+                _logger.error(f"Giving up on job {job_id} after {entry['errors']} failed status checks: {error}")
+                entry["error"] = str(error)
+                entry["fetched"] = time.monotonic()
+                self._cond.notify_all()
+            else:
+                _logger.warning(f"Failed to refresh status for job {job_id}: {error}")
+
+    def _evict_expired(self) -> None:
+        """Forgets finished and abandoned jobs that have not been refreshed for `terminal_ttl` seconds."""
+        now = time.monotonic()
+        with self._cond:
+            expired = [job_id for job_id, entry in self._jobs.items()
+                       if self._is_settled(entry) and now - entry["fetched"] > self.terminal_ttl]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    @staticmethod
+    def _is_settled(entry: Dict[str, Any]) -> bool:
+        """True once a job needs no more polling: it finished, or the watcher gave up on it."""
+        return entry["error"] is not None or (
+            entry["record"] is not None and entry["record"].get("status") in TERMINAL_STATUSES)
+
+    def watch(self, job_id: str) -> None:
+        """Starts tracking a job in the background."""
+        with self._cond:
+            entry = self._jobs.setdefault(job_id, {"record": None, "fetched": 0.0, "errors": 0, "error": None})
+            if entry["error"] is not None:
+                entry.update(errors=0, error=None)  # Someone asked again: give the job another chance.
+            self._cond.notify_all()
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """Returns the job status, served from the watcher's cache when fresh."""
+        with self._cond:
+            entry = self._jobs.get(job_id)
+            if entry and entry["record"] is not None:
+                is_terminal = entry["record"].get("status") in TERMINAL_STATUSES
+                if is_terminal or time.monotonic() - entry["fetched"] < self.poll_interval:
+                    return entry["record"]
+        record = self.client.get_conversion_status(job_id)
+        self._update(job_id, record)
+        return record
+
+    def wait(self, job_id: str, model_name: str = "", timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Blocks until the job reaches a terminal status, mirroring `_poll_for_completion`."""
+        from .jingongo import JingongoAPIError, JingongoConversionError, JingongoTimeoutError
+
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        self.watch(job_id)
+        with self._cond:
+            while True:
+                entry = self._jobs.setdefault(job_id, {"record": None, "fetched": 0.0, "errors": 0, "error": None})
+                record = entry["record"]
+                if record is not None and record.get("status") in TERMINAL_STATUSES:
+                    break
+                if entry["error"] is not None:
+                    raise JingongoAPIError(f"Stopped watching conversion job {job_id}: {entry['error']}")
+                if self._stopped:
+                    raise RuntimeError("Job watcher stopped while waiting for a job.")
+                remaining = None if expires_at is None else expires_at - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise JingongoTimeoutError(f"Deadline exceeded during wait for conversion job {job_id}.")
+                self._cond.wait(remaining)
+        if record["status"] == "FAILED":
+            error_message = record.get("error_message", "N/A")
+            _logger.error(f"FMU conversion for '{model_name}' FAILED. Details: {error_message}")
+            raise JingongoConversionError(f"FMU cloud conversion failed: {error_message}")
+        return record
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                pending = [job_id for job_id, entry in self._jobs.items() if not self._is_settled(entry)]
+                if not pending:
+                    self._cond.wait(self.terminal_ttl if self._jobs else None)
+                    self._evict_expired()
+                    continue
+            for job_id in pending:
+                try:
+                    self._update(job_id, self.client.get_conversion_status(job_id))
+                except Exception as e:
+                    self._record_error(job_id, e)
+            self._evict_expired()
+            with self._cond:
+                if not self._stopped:
+                    self._cond.wait(self.poll_interval)
+
+
+class _AgentRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server: "_AgentServer" = self.server  # type: ignore[assignment]
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line.decode("utf-8"))
+            command = request["command"]
+            args = request.get("args", {})
+            mismatched = sorted(key for key, value in request.get("identity", {}).items()
+                                if server.identity.get(key) != value)
+            if mismatched:
+                self._send({"ok": False, "error": f"The agent's client differs in: {', '.join(mismatched)}.",
+                            "error_type": IDENTITY_MISMATCH})
+                return
+            if command == "ping":
+                records = iter([{"pid": os.getpid(), "user_id": server.client.user_id}])
+            elif command == "shutdown":
+                threading.Thread(target=server.shutdown, daemon=True).start()
+                records = iter([{"stopping": True}])
+            else:
+                records = server.handler(server.client, command, args, server.watcher)
+            for record in records:
+                self._send({"record": record})
+            self._send({"ok": True})
+        except Exception as e:
+            _logger.error(f"Agent command failed: {e}")
+            self._send({"ok": False, "error": str(e), "error_type": type(e).__name__})
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        self.wfile.write((json.dumps(message, default=str) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+
+if is_supported():
+    class _AgentServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, socket_path: str, client, handler: CommandHandler, watcher: JobWatcher):
+            self.client = client
+            self.identity = client_identity(client.endpoints.urls, client.session.headers.get("X-API-Key"))
+            self.handler = handler
+            self.watcher = watcher
+            super().__init__(socket_path, _AgentRequestHandler)
+
+
+def serve(client, handler: CommandHandler, socket_path: Optional[Union[str, Path]] = None,
+          poll_interval: float = 5.0) -> None:
+    """
+    Runs the agent in the foreground until it receives a `shutdown` command.
+
+    Args:
+        client (Jingongo): An initialized, authenticated client to keep warm.
+        handler (callable): Executes commands; see `jingongo.cli.run_command`.
+        socket_path (str | Path): Where to listen. Defaults to `default_socket_path()`.
+        poll_interval (int): Seconds between background job status refreshes.
+    """
+    if not is_supported():
+        raise RuntimeError("The Jingongo agent requires Unix domain socket support.")
+    socket_path = Path(socket_path) if socket_path else default_socket_path()
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if socket_path.exists():
+        try:
+            for _ in call_agent(socket_path, "ping"):
+                pass
+        except OSError:
+            socket_path.unlink()  # Stale socket left behind by a dead agent.
+        else:
+            raise RuntimeError(f"A Jingongo agent is already listening on {socket_path}.")
+
+    watcher = JobWatcher(client, poll_interval=poll_interval)
+    watcher.start()
+    old_umask = os.umask(0o177)
+    try:
+        server = _AgentServer(str(socket_path), client, handler, watcher)
+    finally:
+        os.umask(old_umask)
+    _logger.info(f"Jingongo agent listening on {socket_path}")
+    try:
+        with server:
+            server.serve_forever()
+    finally:
+        watcher.stop()
+        if socket_path.exists():
+            socket_path.unlink()
+        _logger.info("Jingongo agent stopped.")
@@ -0,0 +1,237 @@
+# src/jingongo/cli.py
+
+"""
+The `jingongo` command line interface.
+
+Every command writes its results to stdout as JSON lines. When a local agent
+(see `jingongo agent start`) is running, commands are forwarded to it over a
+Unix socket; otherwise a client is created in-process.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, List
+
+from . import __version__
+from . import agent
+
+_logger = logging.getLogger(__name__)
+
+
+def run_command(client, command: str, args: Dict[str, Any], watcher: Optional["agent.JobWatcher"] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Executes a CLI command against an initialized client, yielding output records.
+
+    This is shared by the in-process CLI and the agent. When a `watcher` is given,
+    status lookups and waits go through its shared polling loop.
+    """
+    if command == "list":
+        models = client.list_models(limit=args.get("limit", 20))
+        if isinstance(models, list):
+            yield from models
+        else:
+            yield models
+    elif command == "status":
+        job_id = args["job_id"]
+        yield watcher.status(job_id) if watcher else client.get_conversion_status(job_id)
+    elif command == "download":
+        job_id = args["job_id"]
+        fmu_path = client.download_fmu(job_id, download_dir=args.get("download_dir", "."),
+                                       extract_dir=args.get("extract_dir"),
+                                       platform_binaries_only=args.get("platform_binaries_only", False),
+                                       deadline=args.get("deadline"))
+        record = {"job_id": job_id, "path": str(fmu_path)}
+        if args.get("extract_dir"):
+            record["extract_dir"] = args["extract_dir"]
+        yield record
+    elif command == "convert":
+        options = dict(args.get("options", {}))
+        delta_upload = options.pop("delta_upload", False)
+        wait = args.get("wait", True)
+        poll_interval = args.get("poll_interval", 5)
+        deadline = args.get("deadline")
+        if watcher and wait:
+            started = time.monotonic()
+            submitted = client.convert_to_fmu(args["project_path"], wait_for_completion=False, deadline=deadline,
+                                              delta_upload=delta_upload, config_overrides=options)
+            remaining = None if deadline is None else max(0.0, deadline - (time.monotonic() - started))
+            yield watcher.wait(submitted["job_id"], options.get("model_name", ""), timeout=remaining)
+        else:
+            yield client.convert_to_fmu(args["project_path"], wait_for_completion=wait, poll_interval=poll_interval,
+                                        deadline=deadline, delta_upload=delta_upload, config_overrides=options)
+    else:
+        raise ValueError(f"Unknown command: '{command}'")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="jingongo",
+        description="Convert, track and download FMUs with the Jingongo platform. Output is JSON lines.",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("--api-url", default=os.environ.get("JINGONGO_API_BASE_URL"),
+                        help="Jingongo API base URL, or a comma-separated list of regional endpoints "
+                             "(default: $JINGONGO_API_BASE_URL).")
+    parser.add_argument("--api-key", default=os.environ.get("JINGONGO_API_KEY"),
+                        help="Jingongo API key (default: $JINGONGO_API_KEY).")
+    parser.add_argument("--socket", type=Path, default=None,
+                        help="Agent socket path (default: $JINGONGO_AGENT_SOCKET or ~/.jingongo/agent.sock).")
+    parser.add_argument("--no-agent", action="store_true",
+                        help="Never forward the command to a running agent.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log SDK activity to stderr.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert = subparsers.add_parser("convert", help="Convert a local project into an FMU.")
+    convert.add_argument("project_path", type=Path, help="Directory containing the model project.")
+    convert.add_argument("--no-wait", action="store_true", help="Return as soon as the job is submitted.")
+    convert.add_argument("--poll-interval", type=int, default=5, help="Seconds between status checks.")
+    convert.add_argument("--model-name", help="Override the model name.")
+    convert.add_argument("--model-version", dest="version", help="Override the model version.")
+    convert.add_argument("--language", help="Override the model language (e.g. python, c).")
+    convert.add_argument("--fmi-type", help="Override the FMI type (CoSimulation or ModelExchange).")
+    convert.add_argument("--deadline", type=float, help="Give up after this many seconds.")
+    convert.add_argument("--delta", dest="delta_upload", action="store_true",
+                         help="Only upload files that changed since the previous upload.")
+
+    status = subparsers.add_parser("status", help="Show the status of a conversion job.")
+    status.add_argument("job_id", help="The conversion job ID.")
+
+    download = subparsers.add_parser("download", help="Download the FMU of a completed job.")
+    download.add_argument("job_id", help="The conversion job ID.")
+    download.add_argument("--dir", dest="download_dir", type=Path, default=Path("."),
+                          help="Directory to save the FMU in.")
+    download.add_argument("--extract-dir", type=Path, help="Also extract the FMU into this directory while downloading.")
+    download.add_argument("--deadline", type=float, help="Give up after this many seconds.")
+    download.add_argument("--platform-only", dest="platform_binaries_only", action="store_true",
+                          help="With --extract-dir, only extract the binaries for this platform.")
+
+    list_parser = subparsers.add_parser("list", help="List recent conversion jobs, one per line.")
+    list_parser.add_argument("--limit", type=int, default=20, help="Maximum number of jobs to list.")
+
+    agent_parser = subparsers.add_parser("agent", help="Manage the local agent.")
+    agent_parser.add_argument("action", choices=["start", "stop", "status"])
+    agent_parser.add_argument("--poll-interval", type=float, default=5.0,
+                              help="Seconds between background job status refreshes.")
+    return parser
+
+
+def _command_args(args: argparse.Namespace) -> Dict[str, Any]:
+    """Converts parsed arguments into the JSON-serializable form sent to the agent."""
+    if args.command == "convert":
+        options = {key: getattr(args, key) for key in ("model_name", "version", "language", "fmi_type")
+                   if getattr(args, key) is not None}
+        if args.delta_upload:
+            options["delta_upload"] = True
+        return {
+            "project_path": str(args.project_path.resolve()),
+            "wait": not args.no_wait,
+            "poll_interval": args.poll_interval,
+            "deadline": args.deadline,
+            "options": options,
+        }
+    if args.command in ("status", "download"):
+        command_args: Dict[str, Any] = {"job_id": args.job_id}
+        if args.command == "download":
+            command_args["download_dir"] = str(args.download_dir.resolve())
+            command_args["deadline"] = args.deadline
+            command_args["platform_binaries_only"] = args.platform_binaries_only
+            if args.extract_dir is not None:
+                command_args["extract_dir"] = str(args.extract_dir.resolve())
+        return command_args
+    return {"limit": args.limit}
+
+
+def _emit(record: Dict[str, Any]) -> None:
+    sys.stdout.write(json.dumps(record, default=str) + "\n")
+    sys.stdout.flush()
+
+
+def _emit_error(error: Exception, error_type: Optional[str] = None) -> int:
+    sys.stderr.write(json.dumps({"error": str(error), "error_type": error_type or type(error).__name__}) + "\n")
+    return 1
+
+
+def _api_urls(args: argparse.Namespace) -> List[str]:
+    return [url.strip() for url in (args.api_url or "").split(",") if url.strip()]
+
+
+def _create_client(args: argparse.Namespace):
+    from .jingongo import Jingongo
+    api_urls = _api_urls(args)
+    return Jingongo(api_urls[0] if len(api_urls) == 1 else api_urls, args.api_key, verbose=args.verbose)
+
+
+def _agent_records(args: argparse.Namespace, command_args: Dict[str, Any], socket_path: Path) -> Optional[Iterator[Dict[str, Any]]]:
+    """
+    Forwards the command to a running agent serving the same API URLs and key.
+
+    Returns None (so the command runs in-process) if no agent is reachable or it
+    uses different credentials. The agent refuses a mismatch before sending any
+    record, so the first record is read here to detect that.
+    """
+    try:
+        records = agent.call_agent(socket_path, args.command, command_args,
+                                   identity=agent.client_identity(_api_urls(args), args.api_key))
+    except OSError as e:
+        _logger.info(f"Agent at {socket_path} is unavailable ({e}); running in-process.")
+        return None
+    try:
+        first = next(records, None)
+    except agent.JingongoAgentError as e:
+        if e.error_type != agent.IDENTITY_MISMATCH:
+            raise
+        _logger.info(f"Agent at {socket_path} serves other credentials ({e}); running in-process.")
+        return None
+    return records if first is None else itertools.chain([first], records)
+
+
+def _agent_command(args: argparse.Namespace, socket_path: Path) -> int:
+    if args.action == "start":
+        client = _create_client(args)
+        agent.serve(client, run_command, socket_path=socket_path, poll_interval=args.poll_interval)
+        return 0
+    try:
+        for record in agent.call_agent(socket_path, "shutdown" if args.action == "stop" else "ping"):
+            _emit(record)
+    except OSError as e:
+        return _emit_error(RuntimeError(f"No Jingongo agent is listening on {socket_path}: {e}"))
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the `jingongo` console script."""
+    args = _build_parser().parse_args(argv)
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr,
+                            format='%(asctime)s - %(levelname)s - %(message)s')
+    socket_path = args.socket or agent.default_socket_path()
+
+    try:
+        if args.command == "agent":
+            return _agent_command(args, socket_path)
+
+        command_args = _command_args(args)
+        records = None
+        if not args.no_agent and agent.is_supported() and socket_path.exists():
+            records = _agent_records(args, command_args, socket_path)
+        if records is None:
+            records = run_command(_create_client(args), args.command, command_args)
+        for record in records:
+            _emit(record)
+        return 0
+    except agent.JingongoAgentError as e:
+        return _emit_error(e, e.error_type)
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        return _emit_error(e)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+# src/jingongo/deadline.py
+
+"""
+Time budgets and cancellation for long-running SDK operations.
+
+These objects only track state; the client checks them between (and during)
+network operations and raises `JingongoTimeoutError` or `JingongoCancelledError`.
+"""
+
+import time
+import threading
+from typing import Optional, Union
+
+
+class CancellationToken:
+    """
+    A thread-safe flag used to cancel an in-progress operation.
+
+    Pass the same token to `convert_to_fmu` or `download_fmu` and call `cancel()`
+    from any thread; polling stops immediately and transfers abort at the next chunk.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Sleeps for up to `timeout` seconds; returns True early if cancelled."""
+        return self._event.wait(timeout)
+
+
+class Deadline:
+    """An absolute point in time by which an operation (or one of its stages) must finish."""
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Args:
+            seconds (float): Time budget from now. None means no deadline.
+        """
+        self._expires_at = None if seconds is None else time.monotonic() + seconds
+
+    @classmethod
+    def coerce(cls, value: Union[None, float, "Deadline"]) -> "Deadline":
+        """Accepts a Deadline, a number of seconds, or None."""
+        return value if isinstance(value, Deadline) else cls(value)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None if there is no deadline."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self._expires_at is not None and time.monotonic() >= self._expires_at
+
+    def stage(self, fraction: float) -> "Deadline":
+        """
+        Returns a sub-deadline for one stage of an operation.
+
+        The stage gets `fraction` of the time currently remaining, so later
+        stages keep their share (and inherit anything an earlier stage did not use).
+        """
+        remaining = self.remaining()
+        return Deadline(None if remaining is None else remaining * fraction)
+
+    def clamp(self, timeout: Optional[float]) -> Optional[float]:
+        """Limits a per-request timeout so it does not outlive the deadline."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return remaining if timeout is None else min(timeout, remaining)
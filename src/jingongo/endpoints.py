@@ -0,0 +1,151 @@
+# src/jingongo/endpoints.py
+
+"""
+Latency- and health-aware selection between several deployments of the API.
+
+`EndpointPool` keeps an exponentially weighted moving average (EWMA) of the
+latency and error rate observed for each endpoint, fed by regular requests and
+by optional background health probes, and routes new requests to the fastest
+healthy endpoint.
+"""
+
+import logging
+import threading
+from typing import Optional, Dict, Any, List, Iterable, Callable
+
+_logger = logging.getLogger(__name__)
+
+
+class _Endpoint:
+    __slots__ = ("url", "index", "latency", "error_rate")
+
+    def __init__(self, url: str, index: int):
+        self.url = url
+        self.index = index
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+
+
+class EndpointPool:
+    """A set of interchangeable API base URLs with EWMA-based routing."""
+
+    def __init__(self, urls: Iterable[str], alpha: float = 0.3, unhealthy_error_rate: float = 0.5):
+        """
+        Args:
+            urls (iterable): API base URLs, in order of preference when nothing is known yet.
+            alpha (float): Weight of the newest sample in the moving averages.
+            unhealthy_error_rate (float): Error-rate EWMA at or above which an endpoint
+                is only used when no healthy endpoint is left.
+        """
+        self._endpoints: Dict[str, _Endpoint] = {}
+        for url in urls:
+            url = url.rstrip('/')
+            if url and url not in self._endpoints:
+                self._endpoints[url] = _Endpoint(url, len(self._endpoints))
+        if not self._endpoints:
+            raise ValueError("At least one API base URL must be provided.")
+        self.alpha = alpha
+        self.unhealthy_error_rate = unhealthy_error_rate
+        self._lock = threading.Lock()
+        self._stop_probing = threading.Event()
+        self._prober: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self._endpoints)
+
+    def _is_healthy(self, endpoint: _Endpoint) -> bool:
+        return endpoint.error_rate < self.unhealthy_error_rate
+
+    def is_healthy(self, url: str) -> bool:
+        with self._lock:
+            return self._is_healthy(self._endpoints[url])
+
+    def choose(self, exclude: Iterable[str] = ()) -> Optional[str]:
+        """
+        Returns the endpoint new requests should use.
+
+        Healthy endpoints with the lowest latency win; endpoints that have not been
+        measured yet come after measured ones, in configuration order. If every
+        endpoint is unhealthy, the one with the lowest error rate is returned.
+        Returns None if all endpoints are excluded.
+        """
+        excluded = set(exclude)
+        with self._lock:
+            candidates = [e for e in self._endpoints.values() if e.url not in excluded]
+            if not candidates:
+                return None
+            healthy = [e for e in candidates if self._is_healthy(e)]
+            if healthy:
+                best = min(healthy, key=lambda e: (e.latency is None, e.latency or 0.0, e.index))
+            else:
+                best = min(candidates, key=lambda e: (e.error_rate, e.index))
+            return best.url
+
+    def record_success(self, url: str, latency: float) -> None:
+        with self._lock:
+            endpoint = self._endpoints.get(url)
+            if endpoint is None:
+                return
+            was_healthy = self._is_healthy(endpoint)
+            endpoint.latency = latency if endpoint.latency is None else (
+                self.alpha * latency + (1 - self.alpha) * endpoint.latency)
+            endpoint.error_rate *= (1 - self.alpha)
+            recovered = not was_healthy and self._is_healthy(endpoint)
+        if recovered:
+            _logger.info(f"Endpoint {url} is healthy again.")
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            endpoint = self._endpoints.get(url)
+            if endpoint is None:
+                return
+            was_healthy = self._is_healthy(endpoint)
+            endpoint.error_rate = self.alpha + (1 - self.alpha) * endpoint.error_rate
+            degraded = was_healthy and not self._is_healthy(endpoint)
+        if degraded:
+            _logger.warning(f"Endpoint {url} is degraded; routing new requests elsewhere.")
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Returns the current latency, error rate and health of every endpoint."""
+        with self._lock:
+            return [{"url": e.url, "latency": e.latency, "error_rate": e.error_rate, "healthy": self._is_healthy(e)}
+                    for e in self._endpoints.values()]
+
+    # --- Background probing ---
+
+    def start_probing(self, probe: Callable[[str], Any], interval: float) -> None:
+        """
+        Calls `probe(url)` for every endpoint now and then every `interval` seconds.
+
+        The probe is expected to record its own outcome (e.g. by going through the
+        client's request path); exceptions it raises are ignored. Probing stops
+        for good when the probe returns False.
+        """
+        if self._prober is not None:
+            return
+        self._stop_probing.clear()
+
+        def run():
+            while not self._stop_probing.is_set():
+                for url in self.urls:
+                    if self._stop_probing.is_set():
+                        return
+                    try:
+                        if probe(url) is False:
+                            return
+                    except Exception as e:
+                        _logger.debug(f"Health probe of {url} failed: {e}")
+                self._stop_probing.wait(interval)
+
+        self._prober = threading.Thread(target=run, name="jingongo-endpoint-prober", daemon=True)
+        self._prober.start()
+
+    def stop_probing(self) -> None:
+        self._stop_probing.set()
+        if self._prober is not None:
+            self._prober.join(timeout=1.0)
+            self._prober = None
@@ -6,15 +6,36 @@ import requests
 import time
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, Union, List
+from typing import Optional, Dict, Any, Union, List, Tuple
 import shutil
 import tempfile
+import hashlib
+import zipfile
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
+from urllib3.exceptions import ReadTimeoutError, MaxRetryError, NewConnectionError, ConnectTimeoutError
+
+from .rate_limit import RateLimiter, classify_endpoint, parse_retry_after
+from .deadline import Deadline, CancellationToken
+from .endpoints import EndpointPool
+from . import _json
+from .records import ConversionJob, ConversionJobList
+from .streaming import (StreamingZipExtractor, UnsupportedZipStream, extract_zip_file, merge_tree,
+                        platform_binaries_filter)
 
 # Set up a logger for the library.
 # Users of the SDK can configure this logger to control output.
 _logger = logging.getLogger(__name__)
 
+# (connect, read) timeout in seconds for requests made without a per-client setting.
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
+# How many uploads and jobs a multi-endpoint client remembers the owning endpoint of.
+MAX_PINNED = 10_000
+
 # --- Custom Exceptions for Clearer Error Handling ---
 
 class JingongoAuthError(Exception):
@@ -25,22 +46,144 @@ class JingongoAPIError(Exception):
     """Raised for general API errors (e.g., bad requests, server errors)."""
     pass
 
+class JingongoRateLimitError(JingongoAPIError):
+    """Raised when the API keeps rejecting requests with HTTP 429 after all retries."""
+    pass
+
+class JingongoIntegrityError(JingongoAPIError):
+    """Raised when a downloaded artifact does not match its expected checksum."""
+    pass
+
+class JingongoTimeoutError(JingongoAPIError):
+    """Raised when a request times out or an operation exceeds its deadline."""
+    pass
+
+class JingongoSubmissionError(JingongoAPIError):
+    """
+    Raised when some conversion variants could not be submitted.
+
+    Attributes:
+        jobs (list): One entry per variant, in order: the accepted job, or None
+            if that variant's submission failed.
+        errors (dict): Maps the index of each failed variant to its exception.
+    """
+
+    def __init__(self, message: str, jobs: List[Any], errors: Dict[int, Exception]):
+        super().__init__(message)
+        self.jobs = jobs
+        self.errors = errors
+
 class JingongoConversionError(Exception):
     """Raised when an FMU conversion job fails on the backend."""
     pass
 
+class JingongoVariantConversionError(JingongoConversionError):
+    """
+    Raised by `convert_variants` when some variants failed to convert.
+
+    Attributes:
+        jobs (list): The final job of every variant, in order, including the completed ones.
+        failed (list): Indices of the variants whose job FAILED.
+    """
+
+    def __init__(self, message: str, jobs: List[Any], failed: List[int]):
+        super().__init__(message)
+        self.jobs = jobs
+        self.failed = failed
+
+class JingongoCancelledError(Exception):
+    """Raised when an operation is stopped through its CancellationToken."""
+    pass
+
+
+def _check_interrupt(deadline: Optional[Deadline], cancel_token: Optional[CancellationToken], action: str) -> None:
+    """Raises if the operation was cancelled or its deadline has passed."""
+    if cancel_token is not None and cancel_token.cancelled:
+        raise JingongoCancelledError(f"Cancelled {action}.")
+    if deadline is not None and deadline.expired:
+        raise JingongoTimeoutError(f"Deadline exceeded during {action}.")
+
+
+def _is_timeout(error: Exception) -> bool:
+    """True for request timeouts, including read timeouts surfaced while streaming a body."""
+    if isinstance(error, requests.exceptions.Timeout):
+        return True
+    return (isinstance(error, requests.exceptions.ConnectionError) and bool(error.args)
+            and isinstance(error.args[0], ReadTimeoutError))
+
+
+def _is_connect_error(error: Exception) -> bool:
+    """True if a request failed while connecting, i.e. before anything was sent to the server."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+        return False
+    reason = error.args[0]
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _weak_probe(client: "Jingongo"):
+    """
+    Returns a health probe for `client.endpoints` that does not keep the client alive.
+
+    Once the client has been garbage collected the probe returns False, which stops
+    the background prober.
+    """
+    client_ref = weakref.ref(client)
+
+    def probe(url: str) -> Optional[bool]:
+        target = client_ref()
+        if target is None:
+            return False
+        target._probe_endpoint(url)
+        return None
+
+    return probe
+
+
+class _InterruptibleReader:
+    """Wraps an upload file so cancellation and the deadline are checked between chunks."""
+
+    def __init__(self, f, size: int, deadline: Optional[Deadline], cancel_token: Optional[CancellationToken]):
+        self._file = f
+        self._size = size
+        self._deadline = deadline
+        self._cancel_token = cancel_token
+
+    def __len__(self) -> int:
+        return self._size
+
+    def read(self, size: int = -1) -> bytes:
+        _check_interrupt(self._deadline, self._cancel_token, "upload")
+        return self._file.read(size)
+
 
 class Jingongo:
     """The Jingongo Digital Twin Framework SDK."""
 
-    def __init__(self, api_base_url: str, api_key: str, verbose: bool = False):
+    def __init__(self, api_base_url: Union[str, List[str]], api_key: str, verbose: bool = False,
+                 rate_limiter: Optional[RateLimiter] = None, typed_results: bool = False,
+                 timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+                 probe_interval: Optional[float] = 30.0):
         """
         Initializes the Jingongo SDK client.
 
         Args:
-            api_base_url (str): The base URL of your Jingongo cloud API.
+            api_base_url (str | list): The base URL of your Jingongo cloud API, or a list of
+                regional deployments. With several URLs, requests go to the fastest healthy
+                one and fail over automatically; jobs stay on the endpoint that created them.
             api_key (str): The long-lived API key for programmatic access.
             verbose (bool): If True, enables detailed logging to the console.
+            rate_limiter (RateLimiter): Optional limiter to share between clients,
+                threads or processes. A private limiter is created if omitted.
+            typed_results (bool): If True, job-returning methods give `ConversionJob` /
+                `ConversionJobList` records instead of plain dicts.
+            timeout (float | tuple): Per-request `(connect, read)` timeouts in seconds, applied
+                to API calls, uploads and downloads. A single number is used for both.
+            probe_interval (float): Seconds between background health probes when several
+                endpoints are configured. None disables probing.
         """
         if not api_base_url or not api_key:
             raise ValueError("API base URL and API key must be provided.")
@@ -48,18 +191,58 @@ class Jingongo:
         if verbose:
             logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-        self.api_base_url = api_base_url.rstrip('/')
+        self.endpoints = EndpointPool([api_base_url] if isinstance(api_base_url, str) else api_base_url)
+        self.api_base_url = self.endpoints.urls[0]
+        self._upload_endpoints: "OrderedDict[str, str]" = OrderedDict()
+        self._job_endpoints: "OrderedDict[str, str]" = OrderedDict()
+        self._pin_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
             "X-API-Key": api_key,
             "Content-Type": "application/json"
         })
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.typed_results = typed_results
+        self.timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
         self.user_id = None
 
+        if len(self.endpoints) > 1 and probe_interval:
+            self.endpoints.start_probing(_weak_probe(self), probe_interval)
+
         _logger.info("Initializing Jingongo client and verifying API key...")
-        self._verify_api_key()
+        try:
+            self._verify_api_key()
+        except Exception:
+            self.close()
+            raise
         _logger.info("--- Jingongo Client Initialized Successfully ---")
 
+    def close(self) -> None:
+        """Stops background health probing and releases pooled connections."""
+        self.endpoints.stop_probing()
+        self.session.close()
+
+    def __enter__(self) -> "Jingongo":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _probe_endpoint(self, url: str) -> None:
+        """Background health probe: feeds the endpoint statistics, logging failures only at DEBUG."""
+        started = time.monotonic()
+        try:
+            response = self.session.get(f"{url}/health", timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            _logger.debug(f"Health probe of {url} failed: {e}")
+            self.endpoints.record_failure(url)
+            return
+        if response.status_code >= 500:
+            _logger.debug(f"Health probe of {url} failed: HTTP {response.status_code}")
+            self.endpoints.record_failure(url)
+        else:
+            self.endpoints.record_success(url, time.monotonic() - started)
+
     def _verify_api_key(self):
         """Validates the API key against the /auth/me endpoint."""
         try:
@@ -72,39 +255,146 @@ class Jingongo:
             _logger.error("API Key authentication failed.")
             raise
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Helper method to make authenticated API requests."""
-        url = f"{self.api_base_url}{endpoint}"
-        try:
-            response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                raise JingongoAuthError("Authentication failed: The provided API key is invalid or has been revoked.") from e
-            _logger.error(f"HTTP Error: {e.response.status_code} - {e.response.text}")
-            raise JingongoAPIError(f"API request to {url} failed: {e.response.status_code} - {e.response.text}") from e
-        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
-            _logger.error(f"Error during request to {url}: {str(e)}")
-            raise JingongoAPIError(f"Failed to communicate with the Jingongo API at {url}.") from e
-
-    def list_models(self, limit: int = 20) -> List[Dict[str, Any]]:
+    def _request_timeout(self, deadline: Optional[Deadline] = None) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Returns the (connect, read) timeout for a request, shortened to fit the deadline.
+
+        Raises:
+            JingongoTimeoutError: If the deadline leaves no time for the request.
+        """
+        connect_timeout, read_timeout = self.timeout
+        if deadline is None:
+            return connect_timeout, read_timeout
+        connect_timeout, read_timeout = deadline.clamp(connect_timeout), deadline.clamp(read_timeout)
+        if (connect_timeout is not None and connect_timeout <= 0) or (read_timeout is not None and read_timeout <= 0):
+            raise JingongoTimeoutError("Deadline exceeded before the request could be sent.")
+        return connect_timeout, read_timeout
+
+    def _make_request(self, method: str, endpoint: str, deadline: Optional[Deadline] = None,
+                      cancel_token: Optional[CancellationToken] = None, endpoint_url: Optional[str] = None,
+                      **kwargs) -> Dict[str, Any]:
+        """Helper method to make authenticated, rate-limited API requests with bounded timeouts."""
+        return self._routed_request(method, endpoint, deadline, cancel_token, endpoint_url, **kwargs)[0]
+
+    @staticmethod
+    def _can_fail_over(method: str, error: requests.exceptions.RequestException) -> bool:
+        """Whether a failed request may be retried on another endpoint without side effects."""
+        if _is_connect_error(error):
+            return True  # No connection was made, so the request never reached the server.
+        if method.upper() not in ("GET", "HEAD"):
+            # Other connection errors (e.g. "Connection aborted") can happen after the
+            # body was sent, so the server may already have acted on the request.
+            return False
+        if isinstance(error, requests.exceptions.HTTPError):
+            return error.response is not None and error.response.status_code in (502, 503, 504)
+        return isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError))
+
+    def _routed_request(self, method: str, endpoint: str, deadline: Optional[Deadline] = None,
+                        cancel_token: Optional[CancellationToken] = None, endpoint_url: Optional[str] = None,
+                        **kwargs) -> Tuple[Any, str]:
+        """
+        Makes an API request on the best available endpoint, failing over when it is unreachable.
+
+        If `endpoint_url` is given, the request is pinned to that endpoint. Returns the decoded
+        response together with the base URL of the endpoint that served it.
+        """
+        base_url = endpoint_url or self.endpoints.choose()
+        endpoint_class = classify_endpoint(method, endpoint)
+        tried: List[str] = []
+        attempt = 0
+        while True:
+            url = f"{base_url}{endpoint}"
+            try:
+                _check_interrupt(deadline, cancel_token, f"request to {url}")
+                self.rate_limiter.acquire(endpoint_class, deadline=deadline, cancel_token=cancel_token, scope=base_url)
+                _check_interrupt(deadline, cancel_token, f"request to {url}")
+                kwargs["timeout"] = self._request_timeout(deadline)
+                sent_at = time.time()
+                started = time.monotonic()
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except requests.exceptions.RequestException:
+                    self.endpoints.record_failure(base_url)
+                    raise
+                if response.status_code >= 500:
+                    self.endpoints.record_failure(base_url)
+                else:
+                    self.endpoints.record_success(base_url, time.monotonic() - started)
+                if response.status_code == 429:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    self.rate_limiter.on_throttle(endpoint_class, retry_after, sent_at=sent_at, scope=base_url)
+                    if attempt < self.rate_limiter.max_retries:
+                        attempt += 1
+                        continue
+                    raise JingongoRateLimitError(
+                        f"API request to {url} was rate limited {attempt + 1} times; giving up.")
+                response.raise_for_status()
+                self.rate_limiter.on_success(endpoint_class, scope=base_url)
+                return _json.loads(response.content), base_url
+            except requests.exceptions.RequestException as e:
+                if endpoint_url is None and self._can_fail_over(method, e):
+                    tried.append(base_url)
+                    next_url = self.endpoints.choose(exclude=tried)
+                    if next_url is not None:
+                        _logger.warning(f"Request to {url} failed ({e}); failing over to {next_url}.")
+                        base_url = next_url
+                        continue
+                if isinstance(e, requests.exceptions.Timeout):
+                    _logger.error(f"Request to {url} timed out: {str(e)}")
+                    raise JingongoTimeoutError(f"API request to {url} timed out.") from e
+                if isinstance(e, requests.exceptions.HTTPError):
+                    if e.response.status_code == 401:
+                        raise JingongoAuthError("Authentication failed: The provided API key is invalid or has been revoked.") from e
+                    _logger.error(f"HTTP Error: {e.response.status_code} - {e.response.text}")
+                    raise JingongoAPIError(f"API request to {url} failed: {e.response.status_code} - {e.response.text}") from e
+                _logger.error(f"Error during request to {url}: {str(e)}")
+                raise JingongoAPIError(f"Failed to communicate with the Jingongo API at {url}.") from e
+            except json.JSONDecodeError as e:
+                _logger.error(f"Error during request to {url}: {str(e)}")
+                raise JingongoAPIError(f"Failed to communicate with the Jingongo API at {url}.") from e
+
+    def _pin(self, registry: "OrderedDict[str, str]", key: Optional[str], base_url: str) -> None:
+        """
+        Remembers which endpoint owns an upload or job this client created, so follow-up
+        calls go there. Only the `MAX_PINNED` most recent entries are kept.
+        """
+        if key and len(self.endpoints) > 1:
+            with self._pin_lock:
+                registry[key] = base_url
+                registry.move_to_end(key)
+                while len(registry) > MAX_PINNED:
+                    registry.popitem(last=False)
+
+    def _as_job(self, data: Dict[str, Any]) -> Union[Dict[str, Any], ConversionJob]:
+        """Wraps a job dict in a `ConversionJob` when typed results are enabled."""
+        return ConversionJob.from_dict(data) if self.typed_results else data
+
+    def list_models(self, limit: int = 20) -> Union[List[Dict[str, Any]], ConversionJobList]:
         """
         Retrieves a list of the most recent FMU conversion jobs for the user.
         
         Returns:
-            A list of dictionaries, each representing a conversion job.
+            A list of dictionaries, each representing a conversion job, or a
+            `ConversionJobList` if the client was created with `typed_results=True`.
         
         Raises:
             JingongoAPIError: If the API request fails.
         """
         _logger.info(f"Fetching the latest {limit} models from the cloud...")
-        return self._make_request("GET", f"/models?limit={limit}")
+        models = self._make_request("GET", f"/models?limit={limit}")
+        if self.typed_results and isinstance(models, list):
+            return ConversionJobList.from_decoded(models)
+        return models
 
     @staticmethod
-    def generate_api_key_from_token(api_base_url: str, id_token: str) -> str:
+    def generate_api_key_from_token(api_base_url: str, id_token: str,
+                                    timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT) -> str:
         """
         Uses a short-lived user ID token to generate a new long-lived API key.
+
+        Raises:
+            JingongoTimeoutError: If the request times out (see `timeout`, as in `Jingongo`).
+            JingongoAPIError: If the backend rejects the request.
         """
         if not api_base_url or not id_token:
             raise ValueError("api_base_url and id_token must be provided.")
@@ -114,7 +404,7 @@ class Jingongo:
         
         _logger.info("Requesting a new long-lived API key from the backend...")
         try:
-            response = requests.post(api_key_url, headers=headers)
+            response = requests.post(api_key_url, headers=headers, timeout=timeout)
             response.raise_for_status()
             response_data = response.json()
             new_api_key = response_data.get("api_key")
@@ -125,11 +415,70 @@ class Jingongo:
         except requests.exceptions.HTTPError as e:
             _logger.error(f"API key generation failed. Status: {e.response.status_code}, Response: {e.response.text}")
             raise JingongoAPIError(f"API key generation failed: {e.response.status_code}") from e
+        except requests.exceptions.Timeout as e:
+            _logger.error(f"API key generation request to {api_key_url} timed out: {str(e)}")
+            raise JingongoTimeoutError(f"API key generation request to {api_key_url} timed out.") from e
 
     # --- Helper methods refactored from convert_to_fmu ---
 
-    def _prepare_and_upload_source(self, project_path: Path, model_name: str, version: str) -> str:
+    @staticmethod
+    def _build_source_manifest(project_path: Path) -> Dict[str, str]:
+        """Maps every file in a project (relative POSIX path) to its SHA-256 digest."""
+        manifest = {}
+        for file_path in sorted(p for p in project_path.rglob("*") if p.is_file()):
+            digest = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            manifest[file_path.relative_to(project_path).as_posix()] = digest.hexdigest()
+        return manifest
+
+    @staticmethod
+    def _zip_files(project_path: Path, relative_paths: List[str], zip_path: Path) -> Path:
+        """Writes the given project files into a zip archive, preserving relative paths."""
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for relative_path in relative_paths:
+                archive.write(project_path / relative_path, arcname=relative_path)
+        return zip_path
+
+    def _put_archive(self, upload_url: str, zip_path: Path, deadline: Optional[Deadline] = None,
+                     cancel_token: Optional[CancellationToken] = None) -> None:
+        """Uploads a zip archive to a signed URL."""
+        file_size_bytes = zip_path.stat().st_size
+        _logger.info(f"Uploading {zip_path.name} ({file_size_bytes} bytes) to signed URL...")
+        _check_interrupt(deadline, cancel_token, f"upload of {zip_path.name}")
+        try:
+            with open(zip_path, 'rb') as f:
+                body = _InterruptibleReader(f, file_size_bytes, deadline, cancel_token)
+                upload_response = requests.put(upload_url, data=body, headers={'Content-Type': 'application/zip'},
+                                               timeout=self._request_timeout(deadline))
+                upload_response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            if _is_timeout(e):
+                raise JingongoTimeoutError(f"Upload of {zip_path.name} timed out.") from e
+            raise
+        _logger.info("Upload complete.")
+
+    def _init_upload(self, model_name: str, version: str, file_size_bytes: int, deadline: Optional[Deadline] = None,
+                     cancel_token: Optional[CancellationToken] = None) -> Tuple[str, str]:
+        """Starts a full upload of an archive of `file_size_bytes` bytes; returns (upload_url, upload_id)."""
+        init_payload = {"model_name": model_name, "version": version, "file_size_bytes": file_size_bytes}
+        upload_init_response, base_url = self._routed_request("POST", "/models/upload-init", deadline=deadline,
+                                                              cancel_token=cancel_token, json=init_payload)
+
+        upload_url = upload_init_response.get("upload_url")
+        upload_id = upload_init_response.get("upload_id")
+        if not upload_url or not upload_id:
+            raise JingongoAPIError("Failed to get upload URL or upload ID from server.")
+        self._pin(self._upload_endpoints, upload_id, base_url)
+        return upload_url, upload_id
+
+    def _prepare_and_upload_source(self, project_path: Path, model_name: str, version: str, delta_upload: bool = False,
+                                   deadline: Optional[Deadline] = None, cancel_token: Optional[CancellationToken] = None) -> str:
         """Zips a project directory and uploads it to a signed URL."""
+        if delta_upload:
+            return self._upload_source_delta(project_path, model_name, version, deadline, cancel_token)
+
         _logger.info(f"Zipping project at: {project_path}...")
         with tempfile.TemporaryDirectory() as temp_dir:
             archive_name = f"{project_path.name}_{time.time_ns()}"
@@ -139,26 +488,80 @@ class Jingongo:
             file_size_bytes = zip_path.stat().st_size
             _logger.info(f"Project zipped to: {zip_path} (Size: {file_size_bytes} bytes)")
 
-            init_payload = {"model_name": model_name, "version": version, "file_size_bytes": file_size_bytes}
-            upload_init_response = self._make_request("POST", "/models/upload-init", json=init_payload)
-            
-            upload_url = upload_init_response.get("upload_url")
-            upload_id = upload_init_response.get("upload_id")
-            if not upload_url or not upload_id:
-                raise JingongoAPIError("Failed to get upload URL or upload ID from server.")
+            upload_url, upload_id = self._init_upload(model_name, version, file_size_bytes, deadline, cancel_token)
+            self._put_archive(upload_url, zip_path, deadline=deadline, cancel_token=cancel_token)
+            return upload_id
 
-            _logger.info("Uploading zipped project to signed URL...")
-            with open(zip_path, 'rb') as f:
-                upload_response = requests.put(upload_url, data=f, headers={'Content-Type': 'application/zip'})
-                upload_response.raise_for_status()
-            _logger.info("Upload complete.")
+    def _upload_source_delta(self, project_path: Path, model_name: str, version: str,
+                             deadline: Optional[Deadline] = None, cancel_token: Optional[CancellationToken] = None) -> str:
+        """
+        Uploads only the project files the server does not already hold.
+
+        A per-file manifest (path -> SHA-256) is sent to the upload-init stage and
+        the server answers with `missing_files`, the paths whose content it needs.
+        Only those files are zipped and uploaded. The archive size is not known
+        until then, so the delta init carries no `file_size_bytes`.
+
+        Servers without delta support either reject that init with a 4xx, in which
+        case a regular upload (with the real archive size) is made instead, or accept
+        it without returning `missing_files`, in which case the whole project is
+        uploaded to the URL they returned.
+        """
+        _logger.info(f"Computing file manifest for delta upload of: {project_path}...")
+        manifest = self._build_source_manifest(project_path)
+
+        init_payload = {
+            "model_name": model_name,
+            "version": version,
+            "upload_mode": "delta",
+            "manifest": manifest,
+        }
+        try:
+            upload_init_response, base_url = self._routed_request("POST", "/models/upload-init", deadline=deadline,
+                                                                  cancel_token=cancel_token, json=init_payload)
+        except JingongoAPIError as e:
+            cause = e.__cause__
+            if not (isinstance(cause, requests.exceptions.HTTPError) and cause.response is not None
+                    and 400 <= cause.response.status_code < 500):
+                raise
+            _logger.info(f"Server rejected the delta upload ({cause.response.status_code}); uploading the full project.")
+            return self._prepare_and_upload_source(project_path, model_name, version, deadline=deadline,
+                                                   cancel_token=cancel_token)
+
+        upload_url = upload_init_response.get("upload_url")
+        upload_id = upload_init_response.get("upload_id")
+        missing_files = upload_init_response.get("missing_files")
+        if not upload_id:
+            raise JingongoAPIError("Failed to get upload ID from server.")
+        self._pin(self._upload_endpoints, upload_id, base_url)
+        if missing_files is None:
+            _logger.info("Server does not support delta uploads; uploading the full project.")
+            missing_files = list(manifest)
+        unknown_files = set(missing_files) - set(manifest)
+        if unknown_files:
+            raise JingongoAPIError(f"Server requested files that are not part of the project: {sorted(unknown_files)}")
+
+        if not missing_files:
+            _logger.info(f"Server already holds all {len(manifest)} project files; nothing to upload.")
             return upload_id
+        if not upload_url:
+            raise JingongoAPIError("Failed to get upload URL from server.")
+
+        _logger.info(f"Uploading {len(missing_files)} of {len(manifest)} project files...")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_path = Path(temp_dir) / f"{project_path.name}_{time.time_ns()}_delta.zip"
+            self._zip_files(project_path, missing_files, zip_path)
+            self._put_archive(upload_url, zip_path, deadline=deadline, cancel_token=cancel_token)
+        return upload_id
 
-    def _poll_for_completion(self, job_id: str, poll_interval: int, model_name: str) -> Dict[str, Any]:
+    def _poll_for_completion(self, job_id: str, poll_interval: int, model_name: str, deadline: Optional[Deadline] = None,
+                             cancel_token: Optional[CancellationToken] = None) -> Union[Dict[str, Any], ConversionJob]:
         """Polls the conversion status endpoint until the job is complete or failed."""
         _logger.info("Waiting for cloud conversion to complete...")
         while True:
-            status_response = self.get_conversion_status(job_id)
+            status_response = self._as_job(self._make_request("GET", f"/models/conversion-status/{job_id}",
+                                                              deadline=deadline, cancel_token=cancel_token,
+                                                              endpoint_url=self._job_endpoints.get(job_id)))
             status = status_response.get("status")
             _logger.info(f"Cloud Conversion status for '{model_name}': {status}")
             if status in ["COMPLETED", "FAILED"]:
@@ -169,20 +572,31 @@ class Jingongo:
                     _logger.error(f"FMU conversion for '{model_name}' FAILED. Details: {error_message}")
                     raise JingongoConversionError(f"FMU cloud conversion failed: {error_message}")
                 return status_response
-            time.sleep(poll_interval)
-
-    # --- Main Public Methods ---
+            self._sleep(poll_interval, deadline, cancel_token)
+            _check_interrupt(deadline, cancel_token, f"wait for conversion job {job_id}")
 
-    def convert_to_fmu(self, project_path: Union[str, Path], wait_for_completion: bool = True, poll_interval: int = 5, **kwargs) -> Dict[str, Any]:
+    @staticmethod
+    def _sleep(seconds: float, deadline: Optional[Deadline] = None, cancel_token: Optional[CancellationToken] = None) -> None:
+        """Sleeps between polls, waking early on cancellation and never past the deadline."""
+        if deadline is not None:
+            seconds = deadline.clamp(seconds)
+        if cancel_token is not None:
+            cancel_token.wait(seconds)
+        else:
+            time.sleep(seconds)
+
+    def _load_conversion_config(self, project_path: Path, defaults: Dict[str, Any],
+                                overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Converts a local digital twin project into an FMU via the Jingongo cloud service.
-        Configuration can be passed as keyword arguments or loaded from a `.jingongo.yml` file in the project path.
+        Merges keyword arguments with the project's `.jingongo.yml`, if present.
+
+        Values from the file take precedence over `defaults`; `overrides` take
+        precedence over both.
         """
-        project_path = Path(project_path)
         if not project_path.is_dir():
             raise ValueError(f"Project path '{project_path}' is not a valid directory.")
 
-        config = kwargs.copy()
+        config = defaults.copy()
         config_path = project_path / ".jingongo.yml"
         if config_path.exists():
             _logger.info(f"Found '{config_path.name}', loading configuration from file.")
@@ -190,7 +604,13 @@ class Jingongo:
             with open(config_path, 'r') as f:
                 yaml_data = yaml.safe_load(f).get('model', {})
             config.update(yaml_data)
+        if overrides:
+            config.update(overrides)
+        return config
 
+    @staticmethod
+    def _build_conversion_payload(config: Dict[str, Any]) -> Dict[str, Any]:
+        """Builds the `/models/convert-fmu` payload from a model configuration."""
         input_variables = {
             v["name"]: v.get("type", "Real")
             for v in config.get("inputs", [])
@@ -205,7 +625,7 @@ class Jingongo:
         }
 
         # Build the final payload for the API
-        payload = {
+        return {
             "model_name": config.get("model_name", "UntitledModel"),
             "version": config.get("version", "1.0.0"),
             "description": config.get("description", ""),
@@ -217,60 +637,287 @@ class Jingongo:
             "output_variables": output_variables,
             "parameters": parameters
         }
-        _logger.info(f"Final configuration for conversion: Language = '{payload['language']}', Model = '{payload['model_name']}'")
-
-        upload_id = self._prepare_and_upload_source(project_path, payload['model_name'], payload['version'])
-        payload["upload_id"] = upload_id
 
+    def _submit_conversion(self, payload: Dict[str, Any], deadline: Optional[Deadline] = None,
+                           cancel_token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """Requests an FMU conversion for an uploaded project and returns the API response."""
         _logger.info(f"Requesting FMU conversion for '{payload['model_name']}' via cloud API...")
-        conversion_response = self._make_request("POST", "/models/convert-fmu", json=payload)
+        conversion_response, base_url = self._routed_request(
+            "POST", "/models/convert-fmu", deadline=deadline, cancel_token=cancel_token,
+            endpoint_url=self._upload_endpoints.get(payload.get("upload_id")), json=payload)
         job_id = conversion_response.get("job_id")
         if not job_id:
             raise JingongoAPIError("API did not return a job ID for the conversion request.")
+        self._pin(self._job_endpoints, job_id, base_url)
         _logger.info(f"Conversion job started with ID: {job_id}")
+        return conversion_response
+
+    # --- Main Public Methods ---
 
+    def convert_to_fmu(self, project_path: Union[str, Path], wait_for_completion: bool = True, poll_interval: int = 5,
+                       delta_upload: bool = False, deadline: Optional[float] = None,
+                       cancel_token: Optional[CancellationToken] = None,
+                       config_overrides: Optional[Dict[str, Any]] = None, **kwargs) -> Union[Dict[str, Any], ConversionJob]:
+        """
+        Converts a local digital twin project into an FMU via the Jingongo cloud service.
+        Configuration can be passed as keyword arguments or loaded from a `.jingongo.yml` file in the project path.
+        Settings in `.jingongo.yml` win over keyword arguments; `config_overrides` (e.g.
+        `{"fmi_type": "ModelExchange"}`) win over the file.
+
+        If `delta_upload` is True, only files that changed since a previous upload are sent.
+
+        `deadline` bounds the whole call in seconds: the upload may use up to half of it, and
+        submission and polling share the rest. When it passes, `JingongoTimeoutError` is raised
+        (the job itself keeps running on the server). Calling `cancel()` on `cancel_token` from
+        another thread stops the upload or polling with `JingongoCancelledError`.
+        """
+        project_path = Path(project_path)
+        overall_deadline = Deadline.coerce(deadline)
+        config = self._load_conversion_config(project_path, kwargs, config_overrides)
+        payload = self._build_conversion_payload(config)
+        _logger.info(f"Final configuration for conversion: Language = '{payload['language']}', Model = '{payload['model_name']}'")
+
+        upload_id = self._prepare_and_upload_source(project_path, payload['model_name'], payload['version'], delta_upload,
+                                                    deadline=overall_deadline.stage(0.5), cancel_token=cancel_token)
+        payload["upload_id"] = upload_id
+
+        conversion_response = self._submit_conversion(payload, deadline=overall_deadline, cancel_token=cancel_token)
         if wait_for_completion:
-            return self._poll_for_completion(job_id, poll_interval, payload['model_name'])
+            return self._poll_for_completion(conversion_response["job_id"], poll_interval, payload['model_name'],
+                                             deadline=overall_deadline, cancel_token=cancel_token)
         
-        return conversion_response
+        return self._as_job(conversion_response)
+
+    def convert_variants(self, project_path: Union[str, Path], variants: List[Dict[str, Any]],
+                         wait_for_completion: bool = True, poll_interval: int = 5, delta_upload: bool = False,
+                         max_workers: Optional[int] = None, raise_on_failure: bool = True,
+                         deadline: Optional[float] = None, cancel_token: Optional[CancellationToken] = None,
+                         **kwargs) -> List[Union[Dict[str, Any], ConversionJob]]:
+        """
+        Uploads a project once and converts it into several FMU variants concurrently.
+
+        Each variant is a dict of configuration overrides applied on top of the keyword
+        arguments and `.jingongo.yml` (e.g. `{"fmi_type": "ModelExchange"}` or
+        `{"version": "2.0.0"}`). A `parameters` override may be given either in the
+        `.jingongo.yml` list form, which replaces the parameters, or as a
+        `{name: default}` dict, which only changes those defaults.
+
+        Args:
+            project_path (str | Path): The project directory, uploaded a single time.
+            variants (list): One override dict per FMU to build.
+            wait_for_completion (bool): If True, polls all jobs together until each finishes.
+            poll_interval (int): Seconds between polling rounds.
+            delta_upload (bool): Only upload files that changed since a previous upload.
+            max_workers (int): Maximum concurrent requests. Defaults to one per variant, up to 8.
+            raise_on_failure (bool): If True, raises once all jobs have finished and any failed.
+                If False, failed jobs are returned in place with their FAILED status.
+            deadline (float): Overall time budget in seconds, split as in `convert_to_fmu`.
+            cancel_token (CancellationToken): Stops the upload, submissions or polling when cancelled.
+
+        Returns:
+            One job per variant, in the same order as `variants`.
 
-    def get_conversion_status(self, job_id: str) -> Dict[str, Any]:
+        Raises:
+            JingongoSubmissionError: If any variant could not be submitted. It is raised once
+                every submission has finished and carries the jobs that were accepted.
+            JingongoVariantConversionError: If a job failed and `raise_on_failure` is True. It is
+                raised once every job has finished and carries all of their results.
+        """
+        if not variants:
+            raise ValueError("At least one variant must be provided.")
+        project_path = Path(project_path)
+        overall_deadline = Deadline.coerce(deadline)
+        base_config = self._load_conversion_config(project_path, kwargs)
+        base_payload = self._build_conversion_payload(base_config)
+
+        payloads = []
+        for variant in variants:
+            variant_config = dict(base_config)
+            parameter_defaults = None
+            for key, value in variant.items():
+                if key == "parameters" and isinstance(value, dict):
+                    parameter_defaults = value
+                else:
+                    variant_config[key] = value
+            payload = self._build_conversion_payload(variant_config)
+            if parameter_defaults:
+                payload["parameters"].update(parameter_defaults)
+            payloads.append(payload)
+
+        upload_id = self._prepare_and_upload_source(project_path, base_payload['model_name'], base_payload['version'], delta_upload,
+                                                    deadline=overall_deadline.stage(0.5), cancel_token=cancel_token)
+        _logger.info(f"Submitting {len(payloads)} conversion variants for upload {upload_id}...")
+        for payload in payloads:
+            payload["upload_id"] = upload_id
+
+        workers = max_workers or min(8, len(payloads))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jingongo-variant") as executor:
+            futures = [executor.submit(self._submit_conversion, payload, deadline=overall_deadline,
+                                       cancel_token=cancel_token) for payload in payloads]
+            responses: List[Optional[Dict[str, Any]]] = []
+            errors: Dict[int, Exception] = {}
+            for index, future in enumerate(futures):
+                try:
+                    responses.append(future.result())
+                except Exception as e:
+                    responses.append(None)
+                    errors[index] = e
+            if errors:
+                jobs = [None if response is None else self._as_job(response) for response in responses]
+                details = "; ".join(f"{payloads[index]['model_name']} (variant {index}): {error}"
+                                    for index, error in errors.items())
+                _logger.error(f"Failed to submit {len(errors)} of {len(payloads)} FMU variants: {details}")
+                raise JingongoSubmissionError(
+                    f"{len(errors)} of {len(payloads)} FMU variant submissions failed: {details}",
+                    jobs, errors) from next(iter(errors.values()))
+            if not wait_for_completion:
+                return [self._as_job(response) for response in responses]
+            job_ids = [response["job_id"] for response in responses]
+            results = self._poll_many(job_ids, poll_interval, executor, deadline=overall_deadline, cancel_token=cancel_token)
+
+        failed = [index for index, result in enumerate(results) if result.get("status") == "FAILED"]
+        for index in failed:
+            _logger.error(f"FMU conversion for '{payloads[index]['model_name']}' FAILED. "
+                          f"Details: {results[index].get('error_message', 'N/A')}")
+        jobs = [self._as_job(result) for result in results]
+        if failed and raise_on_failure:
+            details = "; ".join(f"{results[index].get('job_id')}: {results[index].get('error_message', 'N/A')}"
+                                for index in failed)
+            raise JingongoVariantConversionError(
+                f"{len(failed)} of {len(results)} FMU variant conversions failed: {details}", jobs, failed)
+        _logger.info(f"{len(results) - len(failed)} of {len(results)} FMU variant conversions completed successfully.")
+        return jobs
+
+    def _poll_many(self, job_ids: List[str], poll_interval: int, executor: ThreadPoolExecutor,
+                   deadline: Optional[Deadline] = None, cancel_token: Optional[CancellationToken] = None) -> List[Dict[str, Any]]:
+        """Polls several jobs in rounds until all of them are complete or failed."""
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = list(dict.fromkeys(job_ids))
+        while True:
+            statuses = executor.map(
+                lambda job_id: self._make_request("GET", f"/models/conversion-status/{job_id}",
+                                                  deadline=deadline, cancel_token=cancel_token,
+                                                  endpoint_url=self._job_endpoints.get(job_id)),
+                pending)
+            for job_id, status_response in zip(pending, statuses):
+                results[job_id] = status_response
+            pending = [job_id for job_id in pending if results[job_id].get("status") not in ("COMPLETED", "FAILED")]
+            _logger.info(f"Cloud conversion: {len(job_ids) - len(pending)} of {len(job_ids)} variant jobs finished.")
+            if not pending:
+                return [results[job_id] for job_id in job_ids]
+            self._sleep(poll_interval, deadline, cancel_token)
+            _check_interrupt(deadline, cancel_token, f"wait for {len(pending)} variant jobs")
+
+    def get_conversion_status(self, job_id: str) -> Union[Dict[str, Any], ConversionJob]:
         """Retrieves the status of a specific FMU conversion job."""
         _logger.info(f"Fetching status for job ID: {job_id}...")
-        return self._make_request("GET", f"/models/conversion-status/{job_id}")
+        return self._as_job(self._make_request("GET", f"/models/conversion-status/{job_id}",
+                                               endpoint_url=self._job_endpoints.get(job_id)))
+
+    def download_fmu(self, job_id: str, download_dir: Union[str, Path] = ".",
+                     extract_dir: Optional[Union[str, Path]] = None, platform_binaries_only: bool = False,
+                     deadline: Optional[float] = None, cancel_token: Optional[CancellationToken] = None) -> Path:
+        """
+        Downloads a completed FMU from the cloud to a local directory.
+
+        The SHA-256 of the FMU is computed while it downloads and checked against the
+        digest provided by the backend, if any. When `extract_dir` is given, the FMU is
+        also extracted there in the same pass; with `platform_binaries_only`, only the
+        `binaries/` folder for the running platform is extracted. Extracted files only
+        appear in `extract_dir` once the download has been verified; they replace files
+        at the same paths and leave everything else in `extract_dir` untouched.
 
-    def download_fmu(self, job_id: str, download_dir: Union[str, Path] = ".") -> Path:
-        """Downloads a completed FMU from the cloud to a local directory."""
+        `deadline` bounds the whole call in seconds (at most a fifth of it is spent fetching
+        the download URL), and `cancel_token` aborts the transfer at the next chunk. Either
+        way, the partial file is removed.
+
+        Raises:
+            JingongoIntegrityError: If the downloaded FMU does not match the expected digest.
+            JingongoTimeoutError: If a request times out or the deadline passes.
+            JingongoCancelledError: If the download is cancelled.
+            JingongoAPIError: If the download fails.
+            ValueError: If `platform_binaries_only` is set without an `extract_dir`.
+        """
+        if platform_binaries_only and extract_dir is None:
+            raise ValueError("platform_binaries_only requires an extract_dir.")
         _logger.info(f"Requesting download for FMU from job: {job_id}...")
+        overall_deadline = Deadline.coerce(deadline)
         
-        response_data = self._make_request("GET", f"/models/download/{job_id}")
+        response_data = self._make_request("GET", f"/models/download/{job_id}", deadline=overall_deadline.stage(0.2),
+                                           cancel_token=cancel_token, endpoint_url=self._job_endpoints.get(job_id))
         download_url = response_data.get("download_url")
         fmu_filename = response_data.get("fmu_filename")
+        expected_sha256 = response_data.get("sha256")
         if not download_url or not fmu_filename:
             raise JingongoAPIError("Backend did not provide a valid download URL or filename.")
             
         destination_path = Path(download_dir)
         destination_path.mkdir(parents=True, exist_ok=True)
         local_fmu_path = destination_path / fmu_filename
+
+        include = platform_binaries_filter if platform_binaries_only else None
+        staging_dir = None
+        extractor = None
+        if extract_dir is not None:
+            extract_dir = Path(extract_dir)
+            extract_dir.mkdir(parents=True, exist_ok=True)
+            staging_dir = Path(tempfile.mkdtemp(prefix=".jingongo-partial-", dir=extract_dir))
+            extractor = StreamingZipExtractor(staging_dir, include=include)
         
         _logger.info(f"Downloading '{fmu_filename}' to '{local_fmu_path}'...")
         try:
-            with requests.get(download_url, stream=True) as r:
+            digest = hashlib.sha256()
+            _check_interrupt(overall_deadline, cancel_token, f"download of {fmu_filename}")
+            with requests.get(download_url, stream=True, timeout=self._request_timeout(overall_deadline)) as r:
                 r.raise_for_status()
                 total_size = int(r.headers.get('content-length', 0))
                 with open(local_fmu_path, 'wb') as f, tqdm(total=total_size, unit='iB', unit_scale=True, desc=fmu_filename) as bar:
-                    for chunk in r.iter_content(chunk_size=8192):
+                    for chunk in r.iter_content(chunk_size=65536):
+                        _check_interrupt(overall_deadline, cancel_token, f"download of {fmu_filename}")
                         size = f.write(chunk)
+                        digest.update(chunk)
+                        if extractor is not None:
+                            try:
+                                extractor.feed(chunk)
+                            except UnsupportedZipStream as e:
+                                _logger.info(f"Cannot extract while streaming ({e}); extracting after download.")
+                                extractor = None
                         bar.update(size)
+            if extractor is not None:
+                extractor.close()
+
+            actual_sha256 = digest.hexdigest()
+            if expected_sha256 and actual_sha256.lower() != expected_sha256.lower():
+                raise JingongoIntegrityError(
+                    f"Checksum mismatch for {fmu_filename}: expected {expected_sha256}, got {actual_sha256}.")
+            _logger.info(f"Downloaded '{fmu_filename}' (sha256: {actual_sha256}"
+                         f"{', verified' if expected_sha256 else ''}).")
+
+            if staging_dir is not None:
+                if extractor is None:
+                    extract_zip_file(local_fmu_path, staging_dir, include=include)
+                merge_tree(staging_dir, extract_dir)
+                _logger.info(f"Extracted '{fmu_filename}' to '{extract_dir}'.")
             return local_fmu_path
         except Exception as e:
             _logger.error(f"An error occurred during download: {e}")
             if local_fmu_path.exists():
                 os.remove(local_fmu_path)
+            if isinstance(e, (JingongoAPIError, JingongoCancelledError)):
+                raise
+            if _is_timeout(e):
+                raise JingongoTimeoutError(f"Download of {fmu_filename} timed out.") from e
             raise JingongoAPIError(f"Download of {fmu_filename} failed.") from e
-    def health_check(self) -> Dict[str, Any]:
+        finally:
+            if staging_dir is not None:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def health_check(self, endpoint_url: Optional[str] = None) -> Dict[str, Any]:
         """
         Performs a health check on the Jingongo API.
+
+        Args:
+            endpoint_url (str): Check this specific endpoint instead of the currently preferred one.
         
         Returns:
             A dictionary with the health status of the API.
@@ -279,7 +926,7 @@ class Jingongo:
             JingongoAPIError: If the health check fails.
         """
         _logger.info("Performing health check on the Jingongo API...")
-        return self._make_request("GET", "/health")
+        return self._make_request("GET", "/health", endpoint_url=endpoint_url)
     
     @staticmethod
     def get_login_url(portal_url: str = "http://www.jingongo.com") -> str:
@@ -0,0 +1,274 @@
+# src/jingongo/rate_limit.py
+
+import os
+import json
+import time
+import logging
+import threading
+import email.utils
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Union
+
+from .deadline import Deadline, CancellationToken
+
+_logger = logging.getLogger(__name__)
+
+# --- Endpoint classes with independent budgets ---
+
+STATUS = "status"
+UPLOAD = "upload"
+CONVERSION = "conversion"
+DEFAULT = "default"
+
+# Sustained requests per second allowed for each endpoint class. These are the
+# ceilings the limiter recovers towards after being throttled by the API.
+DEFAULT_RATES = {
+    STATUS: 5.0,
+    UPLOAD: 2.0,
+    CONVERSION: 2.0,
+    DEFAULT: 10.0,
+}
+
+
+def classify_endpoint(method: str, endpoint: str) -> str:
+    """Maps an API request onto the endpoint class whose budget it consumes."""
+    path = endpoint.split("?", 1)[0]
+    if path.startswith("/models/conversion-status"):
+        return STATUS
+    if path.startswith("/models/upload-init"):
+        return UPLOAD
+    if path.startswith("/models/convert-fmu"):
+        return CONVERSION
+    return DEFAULT
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a `Retry-After` header value into a delay in seconds.
+
+    The header may contain either a number of seconds or an HTTP date.
+    Returns None if the value is missing or cannot be understood.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@contextmanager
+def _locked_file(path: Path):
+    """Opens `path` for read/write while holding an exclusive OS-level lock."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if os.name == "nt":
+            import msvcrt
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield fd
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield fd
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+class RateLimiter:
+    """
+    An adaptive token-bucket rate limiter with one bucket per endpoint class.
+
+    Every method also takes an optional `scope` (the client passes the API base
+    URL), giving each scope its own set of buckets with the same configured rates,
+    so throttling by one regional deployment does not slow down the others.
+
+    A single instance is safe to share between threads (and between several
+    `Jingongo` clients). When `state_file` is given, the bucket state is kept in
+    that file under an OS lock, so every process pointing at the same file
+    draws from the same budget.
+
+    On a 429 response the rate of the affected class is cut multiplicatively and
+    any `Retry-After` delay is honoured; each successful request then raises the
+    rate additively until it is back at its configured ceiling.
+    """
+
+    def __init__(self,
+                 rates: Optional[Dict[str, float]] = None,
+                 burst: Optional[Dict[str, float]] = None,
+                 state_file: Optional[Union[str, Path]] = None,
+                 min_rate: float = 0.1,
+                 decrease_factor: float = 0.5,
+                 recovery_fraction: float = 0.05,
+                 max_retries: int = 5):
+        """
+        Args:
+            rates (dict): Maximum requests per second for each endpoint class.
+                Classes that are not given fall back to `DEFAULT_RATES`.
+            burst (dict): Bucket capacity for each class. Defaults to one
+                second's worth of requests (at least 1).
+            state_file (str | Path): Optional file used to share bucket state
+                across processes.
+            min_rate (float): Floor the adaptive rate never drops below.
+            decrease_factor (float): Multiplier applied to the rate on a 429.
+            recovery_fraction (float): Fraction of the ceiling added back to the
+                rate after every successful request.
+            max_retries (int): How many times a throttled request is retried
+                before the error is surfaced to the caller.
+        """
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1.")
+        self.max_rates = dict(DEFAULT_RATES)
+        self.max_rates.update(rates or {})
+        if any(rate <= 0 for rate in self.max_rates.values()):
+            raise ValueError("All endpoint rates must be positive.")
+        self.burst = {name: max(1.0, rate) for name, rate in self.max_rates.items()}
+        self.burst.update(burst or {})
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.recovery_fraction = recovery_fraction
+        self.max_retries = max_retries
+        self.state_file = Path(state_file) if state_file else None
+
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, float]] = {}
+
+    # --- State handling (in-memory or file-backed) ---
+
+    @contextmanager
+    def _transaction(self):
+        """Yields the mutable bucket state, persisting it on exit when file-backed."""
+        with self._lock:
+            if self.state_file is None:
+                yield self._state
+                return
+            with _locked_file(self.state_file) as fd:
+                raw = b""
+                while True:
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    raw += chunk
+                try:
+                    state = json.loads(raw.decode("utf-8")) if raw else {}
+                except ValueError:
+                    _logger.warning(f"Ignoring corrupt rate limiter state in {self.state_file}.")
+                    state = {}
+                yield state
+                data = json.dumps(state).encode("utf-8")
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, data)
+
+    def _bucket(self, state: Dict[str, Dict[str, float]], endpoint_class: str, now: float,
+                scope: Optional[str] = None) -> Dict[str, float]:
+        """Returns the refilled bucket for `endpoint_class` within `scope`, creating it if needed."""
+        max_rate = self.max_rates.get(endpoint_class, self.max_rates[DEFAULT])
+        capacity = self.burst.get(endpoint_class, max(1.0, max_rate))
+        key = endpoint_class if scope is None else f"{scope} {endpoint_class}"
+        bucket = state.get(key)
+        if bucket is None:
+            bucket = {"tokens": capacity, "rate": max_rate, "updated": now, "blocked_until": 0.0,
+                      "last_decrease": 0.0}
+            state[key] = bucket
+        elapsed = max(0.0, now - bucket["updated"])
+        bucket["tokens"] = min(capacity, bucket["tokens"] + elapsed * bucket["rate"])
+        bucket["updated"] = now
+        return bucket
+
+    # --- Public API ---
+
+    def acquire(self, endpoint_class: str = DEFAULT, deadline: Optional[Deadline] = None,
+                cancel_token: Optional[CancellationToken] = None, scope: Optional[str] = None) -> float:
+        """
+        Blocks until a request of the given class may be sent.
+
+        Waits never outlive `deadline`, and end as soon as `cancel_token` is cancelled.
+        In either case this returns early without taking a token; callers check the
+        deadline and token afterwards and raise.
+
+        Returns:
+            float: The number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            if (cancel_token is not None and cancel_token.cancelled) or (deadline is not None and deadline.expired):
+                return waited
+            with self._transaction() as state:
+                now = time.time()
+                bucket = self._bucket(state, endpoint_class, now, scope)
+                if bucket["blocked_until"] > now:
+                    delay = bucket["blocked_until"] - now
+                elif bucket["tokens"] >= 1.0:
+                    bucket["tokens"] -= 1.0
+                    return waited
+                else:
+                    delay = (1.0 - bucket["tokens"]) / bucket["rate"]
+            remaining = deadline.remaining() if deadline is not None else None
+            if remaining is not None:
+                delay = min(delay, remaining)
+            started = time.monotonic()
+            if cancel_token is not None:
+                cancel_token.wait(delay)
+            else:
+                time.sleep(delay)
+            waited += time.monotonic() - started
+
+    def on_success(self, endpoint_class: str = DEFAULT, scope: Optional[str] = None) -> None:
+        """Records a successful request, letting the rate recover towards its ceiling."""
+        max_rate = self.max_rates.get(endpoint_class, self.max_rates[DEFAULT])
+        with self._transaction() as state:
+            bucket = self._bucket(state, endpoint_class, time.time(), scope)
+            if bucket["rate"] < max_rate:
+                bucket["rate"] = min(max_rate, bucket["rate"] + max_rate * self.recovery_fraction)
+
+    def on_throttle(self, endpoint_class: str = DEFAULT, retry_after: Optional[float] = None,
+                    sent_at: Optional[float] = None, scope: Optional[str] = None) -> None:
+        """
+        Records a 429 response, backing the class off and honouring `Retry-After`.
+
+        The rate is cut at most once per throttling window: 429s for requests sent
+        (`sent_at`, a `time.time()` timestamp) before the last cut, or arriving within
+        one request interval of it, only refresh the block, so a burst of concurrent
+        rejections does not collapse the rate to `min_rate`.
+        """
+        with self._transaction() as state:
+            now = time.time()
+            bucket = self._bucket(state, endpoint_class, now, scope)
+            last_decrease = bucket.get("last_decrease", 0.0)
+            in_window = (now - last_decrease < 1.0 / bucket["rate"]
+                         or (sent_at is not None and sent_at <= last_decrease))
+            if not in_window:
+                bucket["rate"] = max(self.min_rate, bucket["rate"] * self.decrease_factor)
+                bucket["last_decrease"] = now
+            bucket["tokens"] = 0.0
+            if retry_after:
+                bucket["blocked_until"] = max(bucket["blocked_until"], now + retry_after)
+            new_rate = bucket["rate"]
+        if in_window:
+            return
+        _logger.warning(f"Rate limited on '{endpoint_class}' requests" + (f" to {scope}" if scope else "") + "; "
+                        f"slowing down to {new_rate:.2f} req/s"
+                        + (f" after waiting {retry_after:.1f}s." if retry_after else "."))
+
+    def current_rate(self, endpoint_class: str = DEFAULT, scope: Optional[str] = None) -> float:
+        """Returns the current (adapted) rate for an endpoint class in requests per second."""
+        with self._transaction() as state:
+            return self._bucket(state, endpoint_class, time.time(), scope)["rate"]
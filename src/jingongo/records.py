@@ -0,0 +1,314 @@
+# src/jingongo/records.py
+
+"""
+Compact, typed representations of conversion jobs.
+
+`ConversionJob` uses `__slots__` and keeps the fields every job has, plus the
+common optional ones, as attributes; optional fields hold the raw strings
+returned by the API, and timestamps are only parsed on first access. Fields
+the SDK does not know about are kept in a separate `extra` dict.
+`ConversionJobList` stores bulk listings column-wise, with statuses packed
+into a byte array, and only materializes `ConversionJob` objects on access.
+Both convert back to the plain dict form with `to_dict()` / `to_dicts()`.
+"""
+
+import sys
+from array import array
+from enum import Enum
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Union, overload
+
+# Fields stored as attributes; everything else goes into the raw `extra` dict.
+_CORE_FIELDS = ("job_id", "status", "model_name", "version")
+# Common optional fields, stored as raw values in their own attributes/columns when present.
+_OPTIONAL_FIELDS = ("created_at", "updated_at", "error_message", "fmu_filename")
+_KNOWN_FIELDS = frozenset(_CORE_FIELDS + _OPTIONAL_FIELDS)
+
+
+class JobStatus(str, Enum):
+    """The lifecycle states of a conversion job."""
+    PENDING = "PENDING"
+    QUEUED = "QUEUED"
+    PROCESSING = "PROCESSING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+    UNKNOWN = "UNKNOWN"
+
+    @property
+    def is_terminal(self) -> bool:
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> "JobStatus":
+        """Maps a status string onto a member, falling back to UNKNOWN."""
+        member = _STATUS_BY_VALUE.get(value) if value is not None else None
+        return member if member is not None else cls.UNKNOWN
+
+
+_STATUS_BY_VALUE = {member.value: member for member in JobStatus}
+_STATUS_BY_INDEX = list(JobStatus)
+_STATUS_INDEX = {member: index for index, member in enumerate(_STATUS_BY_INDEX)}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Interns strings that repeat across many jobs (model names, versions)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _split_job(data: Dict[str, Any]):
+    """
+    Splits a job dict into (job_id, status, model_name, version, extra,
+    created_at, updated_at, error_message, fmu_filename).
+    """
+    status_value = data.get("status")
+    status = JobStatus.parse(status_value)
+    # Explicit nulls in optional fields stay in `extra` so `to_dict()` round-trips.
+    extra = {key: value for key, value in data.items()
+             if key not in _KNOWN_FIELDS or (value is None and key in _OPTIONAL_FIELDS)}
+    if status is JobStatus.UNKNOWN and status_value is not None:
+        # Keep statuses the SDK does not know about so `to_dict()` round-trips.
+        extra["status"] = status_value
+    return (data.get("job_id"), status, _intern(data.get("model_name")), _intern(data.get("version")),
+            extra or None, data.get("created_at"), data.get("updated_at"), data.get("error_message"),
+            data.get("fmu_filename"))
+
+
+class ConversionJob:
+    """A single conversion job, as returned by the Jingongo API."""
+
+    __slots__ = ("job_id", "status", "model_name", "version", "_extra", "_created_at", "_updated_at",
+                 "error_message", "fmu_filename", "_parsed")
+
+    def __init__(self, job_id: Optional[str], status: JobStatus = JobStatus.UNKNOWN,
+                 model_name: Optional[str] = None, version: Optional[str] = None,
+                 extra: Optional[Dict[str, Any]] = None, created_at: Optional[str] = None,
+                 updated_at: Optional[str] = None, error_message: Optional[str] = None,
+                 fmu_filename: Optional[str] = None):
+        self.job_id = job_id
+        self.status = status
+        self.model_name = model_name
+        self.version = version
+        self._extra = extra
+        self._created_at = created_at
+        self._updated_at = updated_at
+        self.error_message = error_message
+        self.fmu_filename = fmu_filename
+        self._parsed: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConversionJob":
+        return cls(*_split_job(data))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the job in the plain dict form used by the API. Missing core fields are omitted."""
+        data: Dict[str, Any] = {}
+        if self.job_id is not None:
+            data["job_id"] = self.job_id
+        if self.status is not JobStatus.UNKNOWN:
+            data["status"] = self.status.value
+        if self.model_name is not None:
+            data["model_name"] = self.model_name
+        if self.version is not None:
+            data["version"] = self.version
+        for key in _OPTIONAL_FIELDS:
+            value = self._raw(key)
+            if value is not None:
+                data[key] = value
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    # --- Lazily parsed optional fields ---
+
+    def _raw(self, key: str) -> Any:
+        """Returns the raw value of an optional field, as sent by the API."""
+        if key == "created_at":
+            return self._created_at
+        if key == "updated_at":
+            return self._updated_at
+        return getattr(self, key)
+
+    def _lazy(self, key: str, parser):
+        if self._parsed is None:
+            self._parsed = {}
+        if key not in self._parsed:
+            raw = self._raw(key)
+            self._parsed[key] = parser(raw) if raw is not None else None
+        return self._parsed[key]
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        return self._lazy("created_at", _parse_timestamp)
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        return self._lazy("updated_at", _parse_timestamp)
+
+    @property
+    def extra(self) -> Dict[str, Any]:
+        """Fields returned by the API that have no dedicated attribute."""
+        return dict(self._extra) if self._extra else {}
+
+    # --- Dict-style access for code written against the dict form ---
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "status":
+            if self.status is JobStatus.UNKNOWN:
+                return self._extra.get("status", default) if self._extra else default
+            return self.status.value
+        if key in _CORE_FIELDS:
+            value = getattr(self, key)
+            return default if value is None else value
+        if key in _OPTIONAL_FIELDS:
+            value = self._raw(key)
+            if value is not None:
+                return value
+        return self._extra.get(key, default) if self._extra else default
+
+    def __getitem__(self, key: str) -> Any:
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            raise KeyError(key)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ConversionJob):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ConversionJob(job_id={self.job_id!r}, status={self.status.value}, model_name={self.model_name!r})"
+
+
+class ConversionJobList:
+    """
+    A sequence of conversion jobs stored column-wise.
+
+    Statuses are packed one byte per job and the common optional fields get a
+    column each, so per-job dicts are only kept for fields the SDK does not know.
+    `ConversionJob` objects are only built when an item is accessed, so large
+    listings stay cheap to hold and to filter.
+    """
+
+    __slots__ = ("_job_ids", "_statuses", "_model_names", "_versions", "_extras",
+                 "_created_ats", "_updated_ats", "_error_messages", "_fmu_filenames")
+
+    def __init__(self):
+        self._job_ids: List[Optional[str]] = []
+        self._statuses = array("B")
+        self._model_names: List[Optional[str]] = []
+        self._versions: List[Optional[str]] = []
+        self._extras: List[Optional[Dict[str, Any]]] = []
+        self._created_ats: List[Optional[str]] = []
+        self._updated_ats: List[Optional[str]] = []
+        self._error_messages: List[Optional[str]] = []
+        self._fmu_filenames: List[Optional[str]] = []
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[Dict[str, Any]]) -> "ConversionJobList":
+        jobs = cls()
+        for item in items:
+            jobs.append(item)
+        return jobs
+
+    @classmethod
+    def from_decoded(cls, items: List[Dict[str, Any]]) -> "ConversionJobList":
+        """
+        Like `from_dicts`, but empties `items` while reading it, so each decoded
+        dict can be freed as soon as it is stored and the listing is never held twice.
+        """
+        jobs = cls()
+        items.reverse()
+        while items:
+            jobs.append(items.pop())
+        return jobs
+
+    def append(self, job: Union[ConversionJob, Dict[str, Any]]) -> None:
+        if isinstance(job, ConversionJob):
+            fields = (job.job_id, job.status, job.model_name, job.version, job._extra,
+                      job._created_at, job._updated_at, job.error_message, job.fmu_filename)
+        else:
+            fields = _split_job(job)
+        job_id, status, model_name, version, extra, created_at, updated_at, error_message, fmu_filename = fields
+        self._job_ids.append(job_id)
+        self._statuses.append(_STATUS_INDEX[status])
+        self._model_names.append(model_name)
+        self._versions.append(version)
+        self._extras.append(extra)
+        self._created_ats.append(created_at)
+        self._updated_ats.append(updated_at)
+        self._error_messages.append(error_message)
+        self._fmu_filenames.append(fmu_filename)
+
+    def __len__(self) -> int:
+        return len(self._job_ids)
+
+    def _job(self, index: int) -> ConversionJob:
+        return ConversionJob(self._job_ids[index], _STATUS_BY_INDEX[self._statuses[index]],
+                             self._model_names[index], self._versions[index], self._extras[index],
+                             self._created_ats[index], self._updated_ats[index],
+                             self._error_messages[index], self._fmu_filenames[index])
+
+    @overload
+    def __getitem__(self, index: int) -> ConversionJob: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ConversionJobList": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            jobs = ConversionJobList()
+            for i in range(*index.indices(len(self))):
+                jobs.append(self._job(i))
+            return jobs
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ConversionJobList index out of range")
+        return self._job(index)
+
+    def __iter__(self) -> Iterator[ConversionJob]:
+        for index in range(len(self)):
+            yield self._job(index)
+
+    def with_status(self, status: Union[JobStatus, str]) -> "ConversionJobList":
+        """
+        Returns the jobs in the given status, scanning only the packed status column.
+
+        Raises:
+            ValueError: If `status` is not a `JobStatus` value (e.g. a lowercase or misspelled name).
+        """
+        if not isinstance(status, JobStatus):
+            if status not in _STATUS_BY_VALUE:
+                raise ValueError(f"Unknown job status {status!r}; expected one of {list(_STATUS_BY_VALUE)}.")
+            status = _STATUS_BY_VALUE[status]
+        wanted = _STATUS_INDEX[status]
+        jobs = ConversionJobList()
+        for index, status_index in enumerate(self._statuses):
+            if status_index == wanted:
+                jobs.append(self._job(index))
+        return jobs
+
+    def count_by_status(self) -> Dict[JobStatus, int]:
+        counts = [0] * len(_STATUS_BY_INDEX)
+        for status_index in self._statuses:
+            counts[status_index] += 1
+        return {status: count for status, count in zip(_STATUS_BY_INDEX, counts) if count}
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Returns the listing in the plain list-of-dicts form used by the API."""
+        return [job.to_dict() for job in self]
+
+    def __repr__(self) -> str:
+        return f"ConversionJobList({len(self)} jobs)"
@@ -0,0 +1,289 @@
+# src/jingongo/streaming.py
+
+"""
+Helpers for processing downloaded FMUs while the bytes are still arriving.
+
+FMUs are zip archives. `StreamingZipExtractor` walks the archive's local file
+headers as data is fed to it, so entries can be extracted in the same pass that
+writes and hashes the download instead of re-reading the finished file.
+"""
+
+import os
+import sys
+import zlib
+import struct
+import platform
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Optional, Callable, List, Set, Union
+
+_LOCAL_HEADER_SIGNATURE = 0x04034b50
+_DATA_DESCRIPTOR_SIGNATURE = 0x08074b50
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_ZIP64_EXTRA_ID = 0x0001
+
+_FLAG_ENCRYPTED = 0x0001
+_FLAG_DATA_DESCRIPTOR = 0x0008
+_FLAG_UTF8 = 0x0800
+
+
+class UnsupportedZipStream(Exception):
+    """Raised when an archive uses a layout that cannot be extracted from a stream."""
+    pass
+
+
+def current_platform_tags() -> Set[str]:
+    """
+    Returns the FMU `binaries/` folder names that match the running platform.
+
+    Both the FMI 2 names (e.g. `linux64`) and the FMI 3 names
+    (e.g. `x86_64-linux`) are included.
+    """
+    is_64bit = sys.maxsize > 2 ** 32
+    machine = platform.machine().lower()
+    arch = {"amd64": "x86_64", "x64": "x86_64", "arm64": "aarch64"}.get(machine, machine)
+    if sys.platform.startswith("win"):
+        return {"win64" if is_64bit else "win32", f"{arch}-windows"}
+    if sys.platform == "darwin":
+        return {"darwin64", f"{arch}-darwin"}
+    return {"linux64" if is_64bit else "linux32", f"{arch}-linux"}
+
+
+def platform_binaries_filter(name: str) -> bool:
+    """Selects only the `binaries/<platform>/` entries for the running platform."""
+    parts = PurePosixPath(name).parts
+    return len(parts) > 2 and parts[0] == "binaries" and parts[1] in current_platform_tags()
+
+
+def _safe_target(target_dir: Path, name: str) -> Path:
+    """Resolves an archive member name inside `target_dir`, rejecting path traversal."""
+    member = PurePosixPath(name)
+    if member.is_absolute() or ".." in member.parts or ":" in name:
+        raise zipfile.BadZipFile(f"Refusing to extract unsafe archive member: {name!r}")
+    return target_dir.joinpath(*member.parts)
+
+
+def extract_zip_file(zip_path: Union[str, Path], target_dir: Path,
+                     include: Optional[Callable[[str], bool]] = None) -> List[Path]:
+    """Extracts a zip archive from disk, honouring the same filter as the streaming extractor."""
+    extracted = []
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or (include is not None and not include(info.filename)):
+                continue
+            destination = _safe_target(target_dir, info.filename)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            with archive.open(info) as source, open(destination, "wb") as out:
+                while True:
+                    chunk = source.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+            extracted.append(destination)
+    return extracted
+
+
+def merge_tree(source_dir: Path, target_dir: Path) -> None:
+    """
+    Moves every file under `source_dir` to the same relative path under `target_dir`.
+
+    Existing files at those paths are replaced; everything else already in
+    `target_dir` (including other files in shared directories) is left alone.
+    """
+    for root, _, files in os.walk(source_dir):
+        relative = Path(root).relative_to(source_dir)
+        destination = target_dir / relative
+        destination.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            os.replace(Path(root) / name, destination / name)
+
+
+class StreamingZipExtractor:
+    """
+    A push-style zip extractor fed with consecutive chunks of an archive.
+
+    Only stored and deflated entries are supported. Entries whose sizes are
+    only known from a trailing data descriptor are supported when deflated.
+    Anything else raises `UnsupportedZipStream`, so the caller can fall back to
+    extracting the completed file with `extract_zip_file`.
+    """
+
+    def __init__(self, target_dir: Union[str, Path], include: Optional[Callable[[str], bool]] = None):
+        """
+        Args:
+            target_dir (str | Path): Directory the entries are extracted into.
+            include (callable): Optional predicate on member names; entries for
+                which it returns False are skipped.
+        """
+        self.target_dir = Path(target_dir)
+        self.include = include
+        self.extracted: List[Path] = []
+        self._buffer = bytearray()
+        self._state = "header"
+        self._entry = None
+
+    def feed(self, data: bytes) -> None:
+        """Processes the next chunk of the archive."""
+        if self._state == "done":
+            return
+        self._buffer += data
+        while self._step():
+            pass
+
+    def close(self) -> None:
+        """Verifies that the archive ended on an entry boundary."""
+        if self._state not in ("header", "done") or self._buffer:
+            self._close_entry_file()
+            raise zipfile.BadZipFile("Archive ended in the middle of an entry.")
+
+    # --- Parser state machine ---
+
+    def _step(self) -> bool:
+        if self._state == "header":
+            return self._read_header()
+        if self._state == "data":
+            return self._read_data()
+        if self._state == "descriptor":
+            return self._read_descriptor()
+        self._buffer.clear()
+        return False
+
+    def _read_header(self) -> bool:
+        if len(self._buffer) < 4:
+            return False
+        (signature,) = struct.unpack_from("<I", self._buffer)
+        if signature != _LOCAL_HEADER_SIGNATURE:
+            # The central directory follows the last entry; nothing left to extract.
+            self._state = "done"
+            self._buffer.clear()
+            return False
+        if len(self._buffer) < _LOCAL_HEADER.size:
+            return False
+        (_, _, flags, method, _, _, crc, compressed_size, size,
+         name_length, extra_length) = _LOCAL_HEADER.unpack_from(self._buffer)
+        header_length = _LOCAL_HEADER.size + name_length + extra_length
+        if len(self._buffer) < header_length:
+            return False
+
+        raw_name = bytes(self._buffer[_LOCAL_HEADER.size:_LOCAL_HEADER.size + name_length])
+        name = raw_name.decode("utf-8" if flags & _FLAG_UTF8 else "cp437")
+        extra = bytes(self._buffer[_LOCAL_HEADER.size + name_length:header_length])
+        is_zip64 = False
+        if compressed_size == 0xFFFFFFFF or size == 0xFFFFFFFF:
+            is_zip64 = True
+            size, compressed_size = self._zip64_sizes(extra, size, compressed_size)
+
+        if flags & _FLAG_ENCRYPTED:
+            raise UnsupportedZipStream(f"Entry {name!r} is encrypted.")
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise UnsupportedZipStream(f"Entry {name!r} uses unsupported compression method {method}.")
+        has_descriptor = bool(flags & _FLAG_DATA_DESCRIPTOR)
+        if has_descriptor and method == zipfile.ZIP_STORED:
+            raise UnsupportedZipStream(f"Stored entry {name!r} has no size in its local header.")
+
+        output = None
+        if not name.endswith("/") and (self.include is None or self.include(name)):
+            destination = _safe_target(self.target_dir, name)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            output = open(destination, "wb")
+            self.extracted.append(destination)
+
+        self._entry = {
+            "name": name,
+            "output": output,
+            "crc": crc,
+            "computed_crc": 0,
+            "remaining": None if has_descriptor else compressed_size,
+            "decompressor": zlib.decompressobj(-15) if method == zipfile.ZIP_DEFLATED else None,
+            "zip64": is_zip64,
+            # Skipped entries of known size are dropped without being decompressed.
+            "decode": output is not None or has_descriptor,
+        }
+        del self._buffer[:header_length]
+        self._state = "data"
+        return True
+
+    @staticmethod
+    def _zip64_sizes(extra: bytes, size: int, compressed_size: int):
+        offset = 0
+        while offset + 4 <= len(extra):
+            header_id, data_size = struct.unpack_from("<HH", extra, offset)
+            if header_id == _ZIP64_EXTRA_ID:
+                values = struct.unpack_from(f"<{data_size // 8}Q", extra, offset + 4)
+                index = 0
+                if size == 0xFFFFFFFF:
+                    size = values[index]
+                    index += 1
+                if compressed_size == 0xFFFFFFFF:
+                    compressed_size = values[index]
+                return size, compressed_size
+            offset += 4 + data_size
+        raise zipfile.BadZipFile("Zip64 entry is missing its extended size information.")
+
+    def _write(self, data: bytes) -> None:
+        entry = self._entry
+        if entry["decompressor"] is not None:
+            data = entry["decompressor"].decompress(data)
+        if data:
+            entry["computed_crc"] = zlib.crc32(data, entry["computed_crc"])
+            if entry["output"] is not None:
+                entry["output"].write(data)
+
+    def _read_data(self) -> bool:
+        entry = self._entry
+        if entry["remaining"] is not None:
+            take = min(len(self._buffer), entry["remaining"])
+            if take:
+                if entry["decode"]:
+                    self._write(bytes(self._buffer[:take]))
+                del self._buffer[:take]
+                entry["remaining"] -= take
+            if entry["remaining"] == 0:
+                if entry["decode"] and entry["decompressor"] is not None:
+                    self._write_tail()
+                self._finish_entry(entry["crc"])
+                return True
+            return False
+
+        # Size unknown until the data descriptor: let the deflate stream find its own end.
+        decompressor = entry["decompressor"]
+        self._write(bytes(self._buffer))
+        self._buffer.clear()
+        if decompressor.eof:
+            self._buffer += decompressor.unused_data
+            self._state = "descriptor"
+            return True
+        return False
+
+    def _write_tail(self) -> None:
+        entry = self._entry
+        data = entry["decompressor"].flush()
+        if data:
+            entry["computed_crc"] = zlib.crc32(data, entry["computed_crc"])
+            if entry["output"] is not None:
+                entry["output"].write(data)
+
+    def _read_descriptor(self) -> bool:
+        if len(self._buffer) < 4:
+            return False
+        (first,) = struct.unpack_from("<I", self._buffer)
+        has_signature = first == _DATA_DESCRIPTOR_SIGNATURE
+        length = (4 if has_signature else 0) + 4 + (16 if self._entry["zip64"] else 8)
+        if len(self._buffer) < length:
+            return False
+        (crc,) = struct.unpack_from("<I", self._buffer, 4 if has_signature else 0)
+        del self._buffer[:length]
+        self._finish_entry(crc)
+        return True
+
+    def _finish_entry(self, expected_crc: int) -> None:
+        entry = self._entry
+        self._close_entry_file()
+        if entry["decode"] and entry["computed_crc"] != expected_crc:
+            raise zipfile.BadZipFile(f"CRC mismatch for archive member {entry['name']!r}.")
+        self._entry = None
+        self._state = "header"
+
+    def _close_entry_file(self) -> None:
+        if self._entry and self._entry["output"] is not None and not self._entry["output"].closed:
+            self._entry["output"].close()
@@ -0,0 +1,43 @@
+import pytest
+import os
+import sys
+from unittest import mock
+
+# Add the src directory to the path to allow importing the library
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from jingongo.jingongo import Jingongo
+
+
+@pytest.fixture
+def make_client():
+    """
+    Returns a factory for clients that never contact the real API.
+
+    The factory takes the `Jingongo` constructor arguments (the base URL defaults
+    to a dummy one and background probing is off). The client's session is a Mock
+    unless `mock_session=False` is given.
+    """
+    clients = []
+
+    def factory(api_base_url="http://api.test", mock_session=True, **kwargs):
+        kwargs.setdefault("probe_interval", None)
+        with mock.patch.object(Jingongo, "_verify_api_key"):
+            client = Jingongo(api_base_url=api_base_url, api_key="test-key", **kwargs)
+        if mock_session:
+            client.session = mock.Mock()
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def client(request, make_client):
+    """
+    A client built by `make_client`. Use indirect parametrization to pass
+    constructor arguments, e.g. `@pytest.mark.parametrize("client", [{...}], indirect=True)`.
+    """
+    return make_client(**getattr(request, "param", {}))
@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 from jingongo.jingongo import Jingongo, JingongoAuthError
 
 # A dummy URL for testing purposes
-JINGONGO_API_BASE_URL = os.environ.get('JINGONGO_API_BASE_URL')
+JINGONGO_API_BASE_URL = os.environ.get('JINGONGO_API_BASE_URL') or "http://api.test"
 
 def test_initialization_with_invalid_key():
     """
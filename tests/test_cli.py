@@ -0,0 +1,154 @@
+import pytest
+import os
+import sys
+import json
+import threading
+import time
+import subprocess
+from unittest import mock
+
+# Add the src directory to the path to allow importing the library
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from jingongo import agent, cli
+from jingongo.jingongo import JingongoAPIError, JingongoConversionError
+
+
+def _fake_client(statuses=None):
+    """A stand-in for an authenticated Jingongo client."""
+    client = mock.Mock()
+    client.user_id = "user-1"
+    client.endpoints.urls = ["http://api.test"]
+    client.session.headers = {"X-API-Key": "test-key"}
+    client.list_models.return_value = [{"job_id": "a"}, {"job_id": "b"}]
+    client.get_conversion_status.side_effect = statuses or (lambda job_id: {"job_id": job_id, "status": "COMPLETED"})
+    client.convert_to_fmu.return_value = {"job_id": "job-1"}
+    return client
+
+
+def test_list_emits_one_json_line_per_job(capsys):
+    """`jingongo list` writes each job as its own JSON line."""
+    client = _fake_client()
+    with mock.patch.object(cli, "_create_client", return_value=client):
+        exit_code = cli.main(["--no-agent", "list", "--limit", "2"])
+
+    assert exit_code == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == [{"job_id": "a"}, {"job_id": "b"}]
+    client.list_models.assert_called_once_with(limit=2)
+
+
+def test_errors_are_reported_on_stderr(capsys):
+    client = _fake_client()
+    client.get_conversion_status.side_effect = ValueError("boom")
+    with mock.patch.object(cli, "_create_client", return_value=client):
+        exit_code = cli.main(["--no-agent", "status", "job-1"])
+
+    assert exit_code == 1
+    assert json.loads(capsys.readouterr().err) == {"error": "boom", "error_type": "ValueError"}
+
+
+def test_job_watcher_wait_raises_on_failed_job():
+    client = _fake_client(statuses=lambda job_id: {"job_id": job_id, "status": "FAILED", "error_message": "bad"})
+    watcher = agent.JobWatcher(client, poll_interval=0.01)
+    watcher.start()
+    try:
+        with pytest.raises(JingongoConversionError):
+            watcher.wait("job-1")
+    finally:
+        watcher.stop()
+
+
+def test_job_watcher_gives_up_on_jobs_that_keep_erroring():
+    client = _fake_client(statuses=mock.Mock(side_effect=ConnectionError("down")))
+    watcher = agent.JobWatcher(client, poll_interval=0.01, max_errors=3)
+    watcher.start()
+    try:
+        with pytest.raises(JingongoAPIError, match="down"):
+            watcher.wait("job-1", timeout=5)
+        time.sleep(0.05)
+        assert client.get_conversion_status.call_count == 3
+    finally:
+        watcher.stop()
+
+
+def test_job_watcher_forgets_finished_jobs_after_ttl():
+    watcher = agent.JobWatcher(_fake_client(), poll_interval=0.01, terminal_ttl=0.05)
+    watcher.start()
+    try:
+        watcher.wait("job-1", timeout=5)
+        deadline = time.monotonic() + 5
+        while watcher._jobs and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert watcher._jobs == {}
+    finally:
+        watcher.stop()
+
+
+def test_package_exposes_submodules_and_exceptions_lazily():
+    """`import jingongo` keeps `jingongo.jingongo.*` reachable without importing it eagerly."""
+    src = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+    code = ("import sys, jingongo; assert 'requests' not in sys.modules; "
+            "assert jingongo.jingongo.JingongoAPIError is jingongo.JingongoAPIError")
+    subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, "PYTHONPATH": src})
+
+
+def test_convert_options_are_passed_as_config_overrides(tmp_path):
+    """CLI options must win over `.jingongo.yml`, so they are not sent as plain keyword defaults."""
+    client = _fake_client()
+    with mock.patch.object(cli, "_create_client", return_value=client):
+        cli.main(["--no-agent", "convert", str(tmp_path), "--fmi-type", "ModelExchange", "--delta"])
+
+    kwargs = client.convert_to_fmu.call_args.kwargs
+    assert kwargs["config_overrides"] == {"fmi_type": "ModelExchange"}
+    assert kwargs["delta_upload"] is True
+
+
+def _start_agent(client, socket_path):
+    server = threading.Thread(target=agent.serve, args=(client, cli.run_command),
+                              kwargs={"socket_path": socket_path, "poll_interval": 0.01}, daemon=True)
+    server.start()
+    for _ in range(100):
+        if socket_path.exists():
+            break
+        time.sleep(0.01)
+    return server
+
+
+@pytest.mark.skipif(not agent.is_supported(), reason="Unix domain sockets are required.")
+def test_agent_with_other_credentials_is_bypassed(tmp_path, capsys):
+    """A command for another key or URL runs in-process instead of on the agent's client."""
+    socket_path = tmp_path / "agent.sock"
+    agent_client = _fake_client()
+    server = _start_agent(agent_client, socket_path)
+    own_client = _fake_client()
+    own_client.list_models.return_value = [{"job_id": "mine"}]
+    try:
+        with mock.patch.object(cli, "_create_client", return_value=own_client):
+            assert cli.main(["--socket", str(socket_path), "--api-url", "http://api.test",
+                             "--api-key", "other-key", "list"]) == 0
+    finally:
+        cli.main(["--socket", str(socket_path), "agent", "stop"])
+        server.join(timeout=5)
+
+    assert json.loads(capsys.readouterr().out.splitlines()[0]) == {"job_id": "mine"}
+    agent_client.list_models.assert_not_called()
+
+
+@pytest.mark.skipif(not agent.is_supported(), reason="Unix domain sockets are required.")
+def test_commands_round_trip_through_agent(tmp_path, capsys):
+    """A CLI invocation is forwarded to a running agent and its records streamed back."""
+    socket_path = tmp_path / "agent.sock"
+    client = _fake_client()
+    server = _start_agent(client, socket_path)
+
+    credentials = ["--api-url", "http://api.test/", "--api-key", "test-key"]
+    with mock.patch.object(cli, "_create_client", side_effect=AssertionError("must use the agent")):
+        assert cli.main(["--socket", str(socket_path), *credentials, "convert", str(tmp_path)]) == 0
+        assert cli.main(["--socket", str(socket_path), "agent", "stop"]) == 0
+
+    server.join(timeout=5)
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records[0] == {"job_id": "job-1", "status": "COMPLETED"}
+    assert client.convert_to_fmu.call_args.kwargs["wait_for_completion"] is False
+    assert not server.is_alive()
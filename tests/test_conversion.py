@@ -0,0 +1,182 @@
+import pytest
+import os
+import sys
+import json
+import zipfile
+import requests
+from unittest import mock
+
+# Add the src directory to the path to allow importing the library
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from jingongo.jingongo import (Jingongo, JingongoAPIError, JingongoConversionError, JingongoSubmissionError,
+                               JingongoVariantConversionError)
+
+
+@pytest.fixture
+def project(tmp_path):
+    project_path = tmp_path / "model"
+    (project_path / "src").mkdir(parents=True)
+    (project_path / "model.py").write_text("print('model')\n")
+    (project_path / "src" / "helpers.py").write_text("VALUE = 1\n")
+    return project_path
+
+
+def test_manifest_maps_relative_paths_to_digests(project):
+    manifest = Jingongo._build_source_manifest(project)
+
+    assert sorted(manifest) == ["model.py", "src/helpers.py"]
+    assert all(len(digest) == 64 for digest in manifest.values())
+
+
+def test_delta_upload_only_sends_missing_files(client, project):
+    """Only the files the server reports as missing end up in the uploaded archive."""
+    uploaded = {}
+
+    def fake_put(upload_url, zip_path, **kwargs):
+        with zipfile.ZipFile(zip_path) as archive:
+            uploaded["names"] = archive.namelist()
+
+    init_response = {"upload_id": "up-1", "upload_url": "http://storage.test/put", "missing_files": ["src/helpers.py"]}
+    with mock.patch.object(client, "_routed_request", return_value=(init_response, "http://api.test")) as make_request, \
+            mock.patch.object(Jingongo, "_put_archive", side_effect=fake_put):
+        upload_id = client._prepare_and_upload_source(project, "model", "1.0.0", delta_upload=True)
+
+    assert upload_id == "up-1"
+    assert uploaded["names"] == ["src/helpers.py"]
+    init_payload = make_request.call_args.kwargs["json"]
+    assert init_payload["upload_mode"] == "delta"
+    assert "file_size_bytes" not in init_payload
+    assert set(init_payload["manifest"]) == {"model.py", "src/helpers.py"}
+
+
+def test_delta_upload_skips_put_when_nothing_changed(client, project):
+    init_response = {"upload_id": "up-1", "missing_files": []}
+    with mock.patch.object(client, "_routed_request", return_value=(init_response, "http://api.test")), \
+            mock.patch.object(Jingongo, "_put_archive") as put_archive:
+        assert client._prepare_and_upload_source(project, "model", "1.0.0", delta_upload=True) == "up-1"
+    put_archive.assert_not_called()
+
+
+def test_delta_upload_falls_back_to_full_project(client, project):
+    """Servers that accept the init but ignore the manifest get every file on the same upload."""
+    uploaded = {}
+
+    def fake_put(upload_url, zip_path, **kwargs):
+        with zipfile.ZipFile(zip_path) as archive:
+            uploaded["names"] = sorted(archive.namelist())
+        uploaded["url"] = upload_url
+
+    init_response = {"upload_id": "up-1", "upload_url": "http://storage.test/put-1"}
+    with mock.patch.object(client, "_routed_request", return_value=(init_response, "http://api.test")) as make_request, \
+            mock.patch.object(Jingongo, "_put_archive", side_effect=fake_put):
+        upload_id = client._prepare_and_upload_source(project, "model", "1.0.0", delta_upload=True)
+
+    assert uploaded["names"] == ["model.py", "src/helpers.py"]
+    assert make_request.call_count == 1
+    assert (upload_id, uploaded["url"]) == ("up-1", "http://storage.test/put-1")
+
+
+def test_delta_upload_rejected_by_server_uses_regular_upload(client, project):
+    """A 4xx on the delta init falls back to a regular init that announces the real archive size."""
+    uploaded = {}
+
+    def fake_put(upload_url, zip_path, **kwargs):
+        uploaded["url"] = upload_url
+        uploaded["size"] = zip_path.stat().st_size
+
+    rejected = mock.Mock(status_code=422, headers={}, text="file_size_bytes: field required")
+    rejected.raise_for_status.side_effect = requests.exceptions.HTTPError(response=rejected)
+    client.session.request.side_effect = [
+        rejected,
+        mock.Mock(status_code=200, headers={},
+                  content=json.dumps({"upload_id": "up-2", "upload_url": "http://storage.test/put-2"}).encode("utf-8")),
+    ]
+    with mock.patch.object(Jingongo, "_put_archive", side_effect=fake_put):
+        upload_id = client._prepare_and_upload_source(project, "model", "1.0.0", delta_upload=True)
+
+    delta_call, full_call = client.session.request.call_args_list
+    assert "manifest" in delta_call.kwargs["json"]
+    assert full_call.kwargs["json"] == {"model_name": "model", "version": "1.0.0", "file_size_bytes": uploaded["size"]}
+    assert (upload_id, uploaded["url"]) == ("up-2", "http://storage.test/put-2")
+
+
+def test_delta_upload_rejects_unknown_paths(client, project):
+    init_response = {"upload_id": "up-1", "upload_url": "http://storage.test/put", "missing_files": ["../etc/passwd"]}
+    with mock.patch.object(client, "_routed_request", return_value=(init_response, "http://api.test")):
+        with pytest.raises(JingongoAPIError):
+            client._prepare_and_upload_source(project, "model", "1.0.0", delta_upload=True)
+
+
+def test_variants_share_one_upload(client, project):
+    """N variants cost a single upload and are submitted against the same upload_id."""
+    submitted = []
+
+    def fake_request(method, endpoint, *args, **kwargs):
+        if endpoint == "/models/convert-fmu":
+            submitted.append(kwargs["json"])
+            return {"job_id": f"job-{kwargs['json']['fmi_type']}"}, "http://api.test"
+        job_id = endpoint.rsplit("/", 1)[-1]
+        return {"job_id": job_id, "status": "COMPLETED"}, "http://api.test"
+
+    variants = [{"fmi_type": "CoSimulation"}, {"fmi_type": "ModelExchange", "parameters": {"gain": 2.0}}]
+    with mock.patch.object(client, "_prepare_and_upload_source", return_value="up-1") as upload, \
+            mock.patch.object(client, "_routed_request", side_effect=fake_request):
+        results = client.convert_variants(project, variants, poll_interval=0, model_name="Model")
+
+    upload.assert_called_once()
+    assert {payload["upload_id"] for payload in submitted} == {"up-1"}
+    by_type = {payload["fmi_type"]: payload for payload in submitted}
+    assert by_type["ModelExchange"]["parameters"] == {"gain": 2.0}
+    assert [result["job_id"] for result in results] == ["job-CoSimulation", "job-ModelExchange"]
+
+
+def test_variants_report_failures_after_all_finish(client, project):
+    def fake_request(method, endpoint, *args, **kwargs):
+        if endpoint == "/models/convert-fmu":
+            return {"job_id": kwargs["json"]["version"]}, "http://api.test"
+        job_id = endpoint.rsplit("/", 1)[-1]
+        return {"job_id": job_id, "status": "FAILED" if job_id == "2.0.0" else "COMPLETED"}, "http://api.test"
+
+    with mock.patch.object(client, "_prepare_and_upload_source", return_value="up-1"), \
+            mock.patch.object(client, "_routed_request", side_effect=fake_request):
+        results = client.convert_variants(project, [{"version": "1.0.0"}, {"version": "2.0.0"}],
+                                          poll_interval=0, raise_on_failure=False)
+        assert [result["status"] for result in results] == ["COMPLETED", "FAILED"]
+
+        with pytest.raises(JingongoConversionError) as excinfo:
+            client.convert_variants(project, [{"version": "1.0.0"}, {"version": "2.0.0"}], poll_interval=0)
+
+    # The completed variant is still reachable, so its FMU can be downloaded.
+    assert isinstance(excinfo.value, JingongoVariantConversionError)
+    assert [job["status"] for job in excinfo.value.jobs] == ["COMPLETED", "FAILED"]
+    assert excinfo.value.failed == [1]
+
+
+def test_variant_submission_failure_keeps_accepted_jobs(client, project):
+    """One rejected submission does not lose the jobs the server already accepted."""
+    def fake_request(method, endpoint, *args, **kwargs):
+        if kwargs["json"]["version"] == "2.0.0":
+            raise JingongoAPIError("rejected")
+        return {"job_id": kwargs["json"]["version"]}, "http://api.test"
+
+    variants = [{"version": "1.0.0"}, {"version": "2.0.0"}, {"version": "3.0.0"}]
+    with mock.patch.object(client, "_prepare_and_upload_source", return_value="up-1"), \
+            mock.patch.object(client, "_routed_request", side_effect=fake_request) as make_request:
+        with pytest.raises(JingongoSubmissionError) as excinfo:
+            client.convert_variants(project, variants, poll_interval=0)
+
+    assert make_request.call_count == 3  # Nothing is polled after a failed submission.
+    assert [job and job["job_id"] for job in excinfo.value.jobs] == ["1.0.0", None, "3.0.0"]
+    assert list(excinfo.value.errors) == [1]
+
+
+def test_config_overrides_win_over_project_file(client, project):
+    (project / ".jingongo.yml").write_text("model:\n  version: 0.0.1\n  fmi_type: CoSimulation\n")
+
+    config = client._load_conversion_config(project, {"version": "5.0.0", "language": "c"},
+                                            {"fmi_type": "ModelExchange"})
+
+    assert config["fmi_type"] == "ModelExchange"
+    assert config["version"] == "0.0.1"  # Plain keyword arguments are only defaults.
+    assert config["language"] == "c"
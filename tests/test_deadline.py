@@ -0,0 +1,115 @@
+import pytest
+import os
+import sys
+import json
+import threading
+import time
+import requests
+from unittest import mock
+
+# Add the src directory to the path to allow importing the library
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from jingongo.jingongo import Jingongo, JingongoTimeoutError, JingongoCancelledError, DEFAULT_TIMEOUT
+from jingongo.deadline import Deadline, CancellationToken
+
+
+@pytest.fixture
+def client(make_client):
+    """A client with a mocked session that reports jobs as still running."""
+    client = make_client(timeout=(3.0, 20.0))
+    client.session.request.return_value = mock.Mock(
+        status_code=200, headers={}, content=json.dumps({"job_id": "job-1", "status": "RUNNING"}).encode("utf-8"))
+    return client
+
+
+def test_requests_use_timeouts_clamped_to_the_deadline(client):
+    client.get_conversion_status("job-1")
+    assert client.session.request.call_args.kwargs["timeout"] == (3.0, 20.0)
+
+    client._make_request("GET", "/health", deadline=Deadline(5.0))
+    connect_timeout, read_timeout = client.session.request.call_args.kwargs["timeout"]
+    assert connect_timeout <= 3.0 and 4.0 < read_timeout <= 5.0
+
+
+def test_request_timeout_is_reported_as_jingongo_error(client):
+    client.session.request.side_effect = requests.exceptions.ReadTimeout("stalled")
+    with pytest.raises(JingongoTimeoutError):
+        client.health_check()
+
+
+def test_polling_stops_at_the_deadline(client):
+    with pytest.raises(JingongoTimeoutError):
+        client._poll_for_completion("job-1", poll_interval=60, model_name="Model", deadline=Deadline(0.05))
+
+
+def test_cancellation_interrupts_polling_promptly(client):
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel).start()
+    with pytest.raises(JingongoCancelledError):
+        client._poll_for_completion("job-1", poll_interval=60, model_name="Model", cancel_token=token)
+
+
+def test_stage_deadlines_share_the_remaining_budget():
+    assert Deadline().stage(0.5).remaining() is None
+    assert 4.0 < Deadline(10.0).stage(0.5).remaining() <= 5.0
+
+
+def test_cancelled_download_removes_partial_file(client, tmp_path):
+    token = CancellationToken()
+    client._make_request = mock.Mock(return_value={"download_url": "http://storage.test/m.fmu", "fmu_filename": "m.fmu"})
+
+    def chunks():
+        yield b"a" * 10
+        token.cancel()
+        yield b"b" * 10
+
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    response.headers = {}
+    response.iter_content.return_value = chunks()
+    with mock.patch("jingongo.jingongo.requests.get", return_value=response):
+        with pytest.raises(JingongoCancelledError):
+            client.download_fmu("job-1", download_dir=tmp_path, cancel_token=token)
+
+    assert not (tmp_path / "m.fmu").exists()
+
+
+def test_rate_limit_wait_stops_at_the_deadline(client):
+    """A long Retry-After block does not outlive the caller's deadline."""
+    client.rate_limiter.on_throttle("status", retry_after=3.0, scope="http://api.test")
+    started = time.monotonic()
+    with pytest.raises(JingongoTimeoutError):
+        client._make_request("GET", "/models/conversion-status/job-1", deadline=Deadline(0.2))
+    assert time.monotonic() - started < 1.0
+    client.session.request.assert_not_called()
+
+
+def test_rate_limit_wait_is_cancellable(client):
+    client.rate_limiter.on_throttle("status", retry_after=3.0, scope="http://api.test")
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel).start()
+    started = time.monotonic()
+    with pytest.raises(JingongoCancelledError):
+        client._make_request("GET", "/models/conversion-status/job-1", cancel_token=token)
+    assert time.monotonic() - started < 1.0
+
+
+def test_exhausted_deadline_never_reaches_requests(client, tmp_path):
+    """Requests never see a zero timeout; the deadline is reported as a timeout instead."""
+    expired = Deadline(0.0)
+    with pytest.raises(JingongoTimeoutError):
+        client._request_timeout(expired)
+
+    client._make_request = mock.Mock(return_value={"download_url": "http://storage.test/m.fmu", "fmu_filename": "m.fmu"})
+    with mock.patch("jingongo.jingongo.requests.get") as get:
+        with pytest.raises(JingongoTimeoutError):
+            client.download_fmu("job-1", download_dir=tmp_path, deadline=expired)
+    get.assert_not_called()
+
+
+def test_api_key_generation_has_a_timeout():
+    with mock.patch("jingongo.jingongo.requests.post", side_effect=requests.exceptions.ConnectTimeout("slow")) as post:
+        with pytest.raises(JingongoTimeoutError):
+            Jingongo.generate_api_key_from_token("http://api.test", "id-token")
+    assert post.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
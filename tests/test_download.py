@@ -0,0 +1,134 @@
+import pytest
+import os
+import io
+import sys
+import hashlib
+import zipfile
+from unittest import mock
+
+# Add the src directory to the path to allow importing the library
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from jingongo.jingongo import JingongoIntegrityError
+from jingongo.streaming import StreamingZipExtractor, current_platform_tags, platform_binaries_filter
+
+PLATFORM = sorted(current_platform_tags())[0]
+MEMBERS = {
+    "modelDescription.xml": b"<fmiModelDescription/>" * 50,
+    f"binaries/{PLATFORM}/model.so": os.urandom(4096),
+    "binaries/other-platform/model.dll": b"not for us",
+}
+
+
+class _NonSeekable(io.RawIOBase):
+    """Forces zipfile to write data descriptors, like many streaming FMU builders."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer += data
+        return len(data)
+
+
+def _build_fmu(streamed=False):
+    target = _NonSeekable() if streamed else io.BytesIO()
+    with zipfile.ZipFile(target, "w") as archive:
+        for index, (name, data) in enumerate(MEMBERS.items()):
+            compression = zipfile.ZIP_STORED if index == 0 and not streamed else zipfile.ZIP_DEFLATED
+            archive.writestr(name, data, compress_type=compression)
+    return bytes(target.buffer if streamed else target.getvalue())
+
+
+def _feed_in_chunks(extractor, data, chunk_size=7):
+    for offset in range(0, len(data), chunk_size):
+        extractor.feed(data[offset:offset + chunk_size])
+    extractor.close()
+
+
+@pytest.mark.parametrize("streamed", [False, True])
+def test_streaming_extractor_matches_archive_contents(tmp_path, streamed):
+    extractor = StreamingZipExtractor(tmp_path)
+    _feed_in_chunks(extractor, _build_fmu(streamed))
+
+    for name, data in MEMBERS.items():
+        assert (tmp_path / name).read_bytes() == data
+
+
+def test_platform_filter_extracts_only_current_binaries(tmp_path):
+    extractor = StreamingZipExtractor(tmp_path, include=platform_binaries_filter)
+    _feed_in_chunks(extractor, _build_fmu(), chunk_size=1000)
+
+    assert [p.relative_to(tmp_path).as_posix() for p in extractor.extracted] == [f"binaries/{PLATFORM}/model.so"]
+
+
+def test_streaming_extractor_rejects_path_traversal(tmp_path):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("../evil.txt", b"x")
+    with pytest.raises(zipfile.BadZipFile):
+        StreamingZipExtractor(tmp_path / "out").feed(buffer.getvalue())
+
+
+def _serve_download(client, fmu_bytes, sha256):
+    """Makes `client` download `fmu_bytes`; returns the streamed response to patch in."""
+    client._make_request = mock.Mock(return_value={
+        "download_url": "http://storage.test/model.fmu", "fmu_filename": "model.fmu", "sha256": sha256})
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    response.headers = {"content-length": str(len(fmu_bytes))}
+    response.iter_content.return_value = [fmu_bytes[i:i + 100] for i in range(0, len(fmu_bytes), 100)]
+    return response
+
+
+def test_download_verifies_and_extracts_in_one_pass(client, tmp_path):
+    fmu_bytes = _build_fmu()
+    response = _serve_download(client, fmu_bytes, hashlib.sha256(fmu_bytes).hexdigest())
+
+    with mock.patch("jingongo.jingongo.requests.get", return_value=response):
+        fmu_path = client.download_fmu("job-1", download_dir=tmp_path, extract_dir=tmp_path / "extracted")
+
+    assert fmu_path.read_bytes() == fmu_bytes
+    assert (tmp_path / "extracted" / "modelDescription.xml").read_bytes() == MEMBERS["modelDescription.xml"]
+    assert [p.name for p in (tmp_path / "extracted").iterdir() if p.name.startswith(".")] == []
+
+
+def test_download_checksum_mismatch_leaves_nothing_behind(client, tmp_path):
+    response = _serve_download(client, _build_fmu(), "0" * 64)
+
+    with mock.patch("jingongo.jingongo.requests.get", return_value=response):
+        with pytest.raises(JingongoIntegrityError):
+            client.download_fmu("job-1", download_dir=tmp_path, extract_dir=tmp_path / "extracted")
+
+    assert not (tmp_path / "model.fmu").exists()
+    assert list((tmp_path / "extracted").iterdir()) == []
+
+
+def test_platform_only_extraction_merges_into_existing_tree(client, tmp_path):
+    """Files already in extract_dir survive; only the extracted paths are replaced."""
+    fmu_bytes = _build_fmu()
+    response = _serve_download(client, fmu_bytes, hashlib.sha256(fmu_bytes).hexdigest())
+    extract_dir = tmp_path / "extracted"
+    (extract_dir / "binaries" / "win64").mkdir(parents=True)
+    (extract_dir / "binaries" / "win64" / "keep.dll").write_bytes(b"keep")
+    (extract_dir / "binaries" / PLATFORM).mkdir(parents=True)
+    (extract_dir / "binaries" / PLATFORM / "model.so").write_bytes(b"stale")
+    (extract_dir / "binaries" / PLATFORM / "user.so").write_bytes(b"mine")
+
+    with mock.patch("jingongo.jingongo.requests.get", return_value=response):
+        client.download_fmu("job-1", download_dir=tmp_path, extract_dir=extract_dir, platform_binaries_only=True)
+
+    assert (extract_dir / "binaries" / "win64" / "keep.dll").read_bytes() == b"keep"
+    assert (extract_dir / "binaries" / PLATFORM / "user.so").read_bytes() == b"mine"
+    assert (extract_dir / "binaries" / PLATFORM / "model.so").read_bytes() == MEMBERS[f"binaries/{PLATFORM}/model.so"]
+
+
+def test_platform_only_requires_extract_dir(client, tmp_path):
+    _serve_download(client, _build_fmu(), None)
+
+    with pytest.raises(ValueError):
+        client.download_fmu("job-1", download_dir=tmp_path, platform_binaries_only=True)
+    client._make_request.assert_not_called()
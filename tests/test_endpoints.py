@@ -0,0 +1,149 @@
+import pytest
+import os
+import sys
+import gc
+import json
+import time
+import logging
+import requests
+from unittest import mock
+from http.client import RemoteDisconnected
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+# Add the src directory to the path to allow importing the library
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from jingongo.jingongo import Jingongo, JingongoAPIError
+from jingongo.endpoints import EndpointPool
+
+EU = "http://eu.api.test"
+US = "http://us.api.test"
+
+
+def _ok(body):
+    return mock.Mock(status_code=200, headers={}, content=json.dumps(body).encode("utf-8"))
+
+
+@pytest.fixture
+def client(make_client):
+    """A two-region client without background probing or a real API."""
+    return make_client([EU, US])
+
+
+def test_pool_routes_to_fastest_healthy_endpoint():
+    pool = EndpointPool([EU, US])
+    assert pool.choose() == EU  # Nothing measured yet: configuration order.
+
+    pool.record_success(EU, 0.300)
+    pool.record_success(US, 0.050)
+    assert pool.choose() == US
+
+    for _ in range(3):
+        pool.record_failure(US)
+    assert not pool.is_healthy(US)
+    assert pool.choose() == EU
+
+    for _ in range(5):
+        pool.record_success(US, 0.050)
+    assert pool.choose() == US
+
+
+def test_unreachable_endpoint_fails_over(client):
+    client.session.request.side_effect = [requests.exceptions.ConnectionError("refused"), _ok({"status": "ok"})]
+
+    assert client.health_check() == {"status": "ok"}
+    assert [call.args[1] for call in client.session.request.call_args_list] == [f"{EU}/health", f"{US}/health"]
+    assert client.endpoints.choose() == US
+
+
+def test_server_errors_on_submissions_are_not_retried_elsewhere(client):
+    error_response = mock.Mock(status_code=500, headers={}, text="boom")
+    error_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=error_response)
+    client.session.request.return_value = error_response
+
+    with pytest.raises(JingongoAPIError):
+        client._make_request("POST", "/models/convert-fmu", json={})
+    assert client.session.request.call_count == 1
+
+
+def test_submissions_fail_over_only_when_the_connection_was_never_made(client):
+    """An aborted connection may have delivered the POST body, so it is not resent elsewhere."""
+    aborted = requests.exceptions.ConnectionError(
+        ProtocolError("Connection aborted.", RemoteDisconnected("Remote end closed connection without response")))
+    client.session.request.side_effect = [aborted, _ok({"upload_id": "up-1"})]
+    with pytest.raises(JingongoAPIError):
+        client._make_request("POST", "/models/upload-init", json={})
+    assert client.session.request.call_count == 1
+
+    refused = requests.exceptions.ConnectionError(MaxRetryError(None, f"{EU}/models/upload-init",
+                                                                NewConnectionError(None, "Connection refused")))
+    client.session.request.reset_mock()
+    client.session.request.side_effect = [refused, _ok({"upload_id": "up-1"})]
+    assert client._make_request("POST", "/models/upload-init", json={}) == {"upload_id": "up-1"}
+    assert client.session.request.call_count == 2
+
+
+def test_jobs_stick_to_the_endpoint_that_created_them(client):
+    client.endpoints.record_success(US, 0.010)
+    client.session.request.return_value = _ok({"job_id": "job-1"})
+    client._submit_conversion({"model_name": "Model"})
+
+    client.endpoints.record_success(EU, 0.001)
+    for _ in range(5):
+        client.endpoints.record_success(US, 1.0)
+    assert client.endpoints.choose() == EU
+
+    client.session.request.return_value = _ok({"job_id": "job-1", "status": "RUNNING"})
+    client.get_conversion_status("job-1")
+    assert client.session.request.call_args.args[1] == f"{US}/models/conversion-status/job-1"
+
+
+def test_throttling_in_one_region_does_not_slow_the_others(client):
+    """Rate-limit buckets are kept per endpoint, so failing over escapes a throttled region."""
+    client.rate_limiter.on_throttle("status", retry_after=30.0, scope=EU)
+    client.endpoints.record_success(US, 0.010)
+    client.session.request.return_value = _ok({"job_id": "job-1", "status": "RUNNING"})
+
+    started = time.monotonic()
+    client.get_conversion_status("job-1")
+    assert time.monotonic() - started < 1.0
+    assert client.session.request.call_args.args[1] == f"{US}/models/conversion-status/job-1"
+    assert client.rate_limiter.current_rate("status", scope=US) == client.rate_limiter.max_rates["status"]
+
+
+def test_only_created_jobs_are_pinned_and_the_map_is_bounded(client):
+    client.session.request.return_value = _ok([{"job_id": f"listed-{i}"} for i in range(50)])
+    client.list_models(limit=50)
+    assert len(client._job_endpoints) == 0
+
+    with mock.patch("jingongo.jingongo.MAX_PINNED", 3):
+        for i in range(5):
+            client._pin(client._job_endpoints, f"job-{i}", US)
+    assert list(client._job_endpoints) == ["job-2", "job-3", "job-4"]
+
+
+def test_probe_thread_is_quiet_and_does_not_keep_the_client_alive(caplog):
+    def refuse(*args, **kwargs):
+        raise requests.exceptions.ConnectionError("down")
+
+    with mock.patch.object(Jingongo, "_verify_api_key"), mock.patch("jingongo.jingongo.requests.Session") as session:
+        session.return_value.get.side_effect = refuse
+        client = Jingongo(api_base_url=[EU, US], api_key="test-key", probe_interval=0.01)
+    prober = client.endpoints._prober
+    with caplog.at_level(logging.DEBUG, logger="jingongo"):
+        time.sleep(0.05)
+    assert session.return_value.get.called
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+    del client
+    gc.collect()
+    prober.join(timeout=1.0)
+    assert not prober.is_alive()
+
+
+def test_client_is_a_context_manager():
+    with mock.patch.object(Jingongo, "_verify_api_key"), mock.patch("jingongo.jingongo.requests.Session"):
+        with Jingongo(api_base_url=[EU, US], api_key="test-key", probe_interval=60) as client:
+            prober = client.endpoints._prober
+            assert prober.is_alive()
+    assert not prober.is_alive()
@@ -0,0 +1,93 @@
+import pytest
+import os
+import sys
+import json
+import time
+from unittest import mock
+
+# Add the src directory to the path to allow importing the library
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from jingongo.jingongo import JingongoRateLimitError
+from jingongo.rate_limit import RateLimiter, classify_endpoint, parse_retry_after, STATUS, UPLOAD, CONVERSION, DEFAULT
+
+
+def _response(status_code, body=None, headers=None):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(body or {}).encode("utf-8")
+    response.raise_for_status.return_value = None
+    return response
+
+
+def test_endpoints_are_classified_into_separate_budgets():
+    """Status polling, uploads and conversions each draw from their own bucket."""
+    assert classify_endpoint("GET", "/models/conversion-status/abc") == STATUS
+    assert classify_endpoint("POST", "/models/upload-init") == UPLOAD
+    assert classify_endpoint("POST", "/models/convert-fmu") == CONVERSION
+    assert classify_endpoint("GET", "/models?limit=20") == DEFAULT
+
+
+def test_parse_retry_after_accepts_seconds_and_garbage():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not-a-date") is None
+
+
+def test_throttle_lowers_rate_and_success_recovers_it():
+    """A 429 halves the rate; successful requests bring it back gradually."""
+    limiter = RateLimiter(rates={STATUS: 4.0}, recovery_fraction=0.25)
+    limiter.on_throttle(STATUS)
+    assert limiter.current_rate(STATUS) == pytest.approx(2.0)
+
+    limiter.on_success(STATUS)
+    assert limiter.current_rate(STATUS) == pytest.approx(3.0)
+    for _ in range(10):
+        limiter.on_success(STATUS)
+    assert limiter.current_rate(STATUS) == pytest.approx(4.0)
+
+
+def test_burst_of_429s_cuts_the_rate_only_once():
+    """Concurrent rejections of requests sent before the cut count as one throttling event."""
+    limiter = RateLimiter(rates={STATUS: 4.0}, min_rate=0.1)
+    sent_at = time.time()
+    for _ in range(8):
+        limiter.on_throttle(STATUS, sent_at=sent_at)
+    assert limiter.current_rate(STATUS) == pytest.approx(2.0)
+
+
+def test_state_file_is_shared_between_limiters(tmp_path):
+    """Two limiters pointing at the same file behave as one budget."""
+    state_file = tmp_path / "limits.json"
+    first = RateLimiter(rates={UPLOAD: 8.0}, state_file=state_file)
+    second = RateLimiter(rates={UPLOAD: 8.0}, state_file=state_file)
+
+    first.on_throttle(UPLOAD)
+    assert second.current_rate(UPLOAD) == pytest.approx(4.0)
+
+
+def test_make_request_retries_after_429(make_client):
+    """A throttled request is retried and succeeds once the API accepts it."""
+    limiter = RateLimiter(max_retries=2)
+    client = make_client(rate_limiter=limiter)
+    client.session.request.side_effect = [
+        _response(429, headers={"Retry-After": "0"}),
+        _response(200, body={"status": "RUNNING"}),
+    ]
+
+    result = client.get_conversion_status("job-1")
+
+    assert result == {"status": "RUNNING"}
+    assert client.session.request.call_count == 2
+    assert limiter.current_rate(STATUS, scope="http://api.test") < limiter.max_rates[STATUS]
+
+
+def test_make_request_gives_up_after_max_retries(make_client):
+    limiter = RateLimiter(rates={DEFAULT: 1000.0}, max_retries=1)
+    client = make_client(rate_limiter=limiter)
+    client.session.request.return_value = _response(429)
+
+    with pytest.raises(JingongoRateLimitError):
+        client.list_models()
+    assert client.session.request.call_count == 2
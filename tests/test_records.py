@@ -0,0 +1,92 @@
+import pytest
+import os
+import sys
+import json
+from datetime import datetime, timezone
+from unittest import mock
+
+# Add the src directory to the path to allow importing the library
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from jingongo.jingongo import JingongoConversionError
+from jingongo.records import ConversionJob, ConversionJobList, JobStatus
+
+JOB = {
+    "job_id": "job-1",
+    "status": "FAILED",
+    "model_name": "Identity",
+    "version": "1.0.0",
+    "error_message": "compiler error",
+    "created_at": "2026-01-02T03:04:05Z",
+}
+
+
+def test_job_round_trips_to_dict():
+    job = ConversionJob.from_dict(JOB)
+
+    assert job.status is JobStatus.FAILED
+    assert job.status.is_terminal
+    assert job.error_message == "compiler error"
+    assert job.created_at == datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert job.to_dict() == JOB
+    assert job["status"] == "FAILED" and job.get("missing", 42) == 42
+
+
+def test_unknown_status_is_preserved():
+    job = ConversionJob.from_dict({"job_id": "job-2", "status": "ARCHIVED"})
+
+    assert job.status is JobStatus.UNKNOWN
+    assert job.get("status") == "ARCHIVED"
+    assert job.to_dict() == {"job_id": "job-2", "status": "ARCHIVED"}
+
+
+def test_job_list_is_column_backed_and_filterable():
+    jobs = ConversionJobList.from_dicts([
+        JOB,
+        {"job_id": "job-3", "status": "COMPLETED", "model_name": "Identity"},
+        {"job_id": "job-4", "status": "COMPLETED"},
+    ])
+
+    assert len(jobs) == 3
+    assert jobs[-1].job_id == "job-4"
+    assert [job.job_id for job in jobs.with_status("COMPLETED")] == ["job-3", "job-4"]
+    assert jobs.count_by_status() == {JobStatus.FAILED: 1, JobStatus.COMPLETED: 2}
+    assert jobs[1].model_name is jobs[0].model_name  # Repeated names are interned.
+    assert jobs[:1].to_dicts() == [JOB]
+
+
+@pytest.mark.parametrize("client", [{"typed_results": True}], indirect=True)
+def test_typed_client_returns_records(client):
+    response = mock.Mock(status_code=200, headers={}, content=json.dumps([JOB]).encode("utf-8"))
+    client.session.request.return_value = response
+
+    jobs = client.list_models()
+    assert isinstance(jobs, ConversionJobList)
+    assert jobs[0].status is JobStatus.FAILED
+
+    response.content = json.dumps(JOB).encode("utf-8")
+    with pytest.raises(JingongoConversionError):
+        client._poll_for_completion("job-1", poll_interval=0, model_name="Identity")
+
+
+def test_optional_fields_are_columns_and_extra_holds_only_unknown_fields():
+    job = ConversionJob.from_dict(dict(JOB, fmu_filename="Identity.fmu", region="eu"))
+
+    assert job.fmu_filename == "Identity.fmu"
+    assert job.extra == {"region": "eu"}
+    assert ConversionJob.from_dict(JOB)._extra is None
+    assert job.get("created_at") == "2026-01-02T03:04:05Z"
+
+    items = [JOB, {"job_id": "job-5", "status": "RUNNING", "error_message": None}]
+    jobs = ConversionJobList.from_decoded(list(items))
+    assert jobs._extras == [None, {"error_message": None}]
+    assert jobs._error_messages == ["compiler error", None]
+    assert jobs.to_dicts() == items
+
+
+def test_with_status_rejects_unknown_status_names():
+    jobs = ConversionJobList.from_dicts([JOB, {"job_id": "job-2", "status": "ARCHIVED"}])
+
+    with pytest.raises(ValueError):
+        jobs.with_status("failed")
+    assert [job.job_id for job in jobs.with_status(JobStatus.UNKNOWN)] == ["job-2"]